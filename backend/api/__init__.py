@@ -40,8 +40,9 @@ class SimulationState:
             self.attack_generator.update(time_delta=timedelta, connections=connections)
             self.traffic_generator.generate_packets(time_delta=timedelta)
             if random.random() < 0.6:  # Randomly create new connections
-                edge = random.choice(list(self.network.edges.values()))
-                self.traffic_generator.create_connection(edge.source_id, edge.target_id, None)
+                edge = self.network.random_edge()
+                if edge is not None:
+                    self.traffic_generator.create_connection(edge.source_id, edge.target_id, None)
 
 socketio = SocketIO()
 gnn_client = GNNClient()
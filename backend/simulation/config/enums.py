@@ -1,7 +1,7 @@
 from enum import Enum
 # -------- Network Enums --------
 
-class NodeType(Enum):
+class NodeType(str, Enum):
     CLIENT = "client"
     SERVER = "server"
     ROUTER = "router"
@@ -9,7 +9,7 @@ class NodeType(Enum):
     FIREWALL = "firewall"
     HONEYPOT = "honeypot"
 
-class OperatingSystem(Enum):
+class OperatingSystem(str, Enum):
     WINDOWS = "windows"
     LINUX = "linux"
     MACOS = "macos"
@@ -17,7 +17,7 @@ class OperatingSystem(Enum):
     ANDROID = "android"
     CUSTOM = "custom"
 
-class Protocol(Enum):
+class Protocol(str, Enum):
     TCP = "tcp"
     UDP = "udp"
     ICMP = "icmp"
@@ -38,6 +38,13 @@ class Protocol(Enum):
 
     def __init__(self, protocol_name):
         self.protocol_name = protocol_name
+        # Members are created in definition order, so this numbers them 0..N-1
+        self._ordinal = len(type(self)._member_names_)
+    
+    @property
+    def ordinal(self) -> int:
+        """Contiguous 0..N-1 position of this protocol, for tuple-indexed lookup tables"""
+        return self._ordinal
     
     @property
     def is_encrypted(self):
@@ -46,7 +53,7 @@ class Protocol(Enum):
     
 # --------- Packet Enums --------
 
-class PacketType(Enum):
+class PacketType(str, Enum):
     DATA = "data"
     CONTROL = "control"
     MANAGEMENT = "management"
@@ -54,7 +61,7 @@ class PacketType(Enum):
     RESPONSE = "response"
     ROUTING = "routing"  # OSPF, BGP, etc.
 
-class PacketStatus(Enum):
+class PacketStatus(str, Enum):
     """Packet transmission status"""
     CREATED = "created"
     SENT = "sent"
@@ -64,13 +71,13 @@ class PacketStatus(Enum):
     CORRUPTED = "corrupted"
     QUEUED = "queued"  # Waiting in buffer
 
-class Direction(Enum):
+class Direction(str, Enum):
     """Packet direction"""
     INBOUND = "inbound"
     OUTBOUND = "outbound"
     INTERNAL = "internal"
 
-class QoSClass(Enum):
+class QoSClass(str, Enum):
     """Quality of Service classes"""
     BEST_EFFORT = "best_effort"      # Default internet traffic
     BACKGROUND = "background"        # Bulk transfers, backups
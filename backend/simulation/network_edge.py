@@ -1,9 +1,33 @@
 from enum import Enum
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Optional, Final
 from .config.enums import Protocol
 
-@dataclass
+# Protocol security modifiers
+_PROTOCOL_SECURITY_SCORES: Final = MappingProxyType({
+    Protocol.HTTP: 0.3,
+    Protocol.HTTPS: 0.8,
+    Protocol.TCP: 0.5,
+    Protocol.UDP: 0.4,
+    Protocol.TLS: 0.9,
+    Protocol.IPSEC: 0.95,
+    Protocol.SSH: 0.85,
+    Protocol.FTP: 0.2
+})
+
+# Half of each score indexed by Protocol.ordinal (default 0.5), pre-scaled for the average
+_PROTOCOL_SECURITY_HALVES: Final = tuple(_PROTOCOL_SECURITY_SCORES.get(p, 0.5) * 0.5 for p in Protocol)
+
+# Plain attributes copied into to_dict(), read in one C call
+_EDGE_DICT_KEYS: Final = ("id", "source", "target", "bandwidth", "latency", "encryption_level",
+                          "is_monitored", "traffic_volume", "packet_count", "error_rate")
+_get_edge_dict_fields: Final = attrgetter("id", "source_id", "target_id", "bandwidth", "latency",
+                                          "encryption_level", "is_monitored", "traffic_volume",
+                                          "packet_count", "error_rate")
+
+@dataclass(slots=True)
 class NetworkEdge:
     id: str
     source_id: str
@@ -24,43 +48,42 @@ class NetworkEdge:
     packet_count: int = 0
     error_rate: float = 0.0  # 0-1
     
+    # Serialized form, rebuilt lazily after any attribute change
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    # Protocol values, kept across traffic updates until supported_protocols is reassigned
+    _protocol_values: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name == "supported_protocols":
+            object.__setattr__(self, "_protocol_values", None)
+        if name != "_cached_dict":
+            object.__setattr__(self, "_cached_dict", None)
+    
+    def _supported_protocol_values(self) -> tuple:
+        values = self._protocol_values
+        if values is None:
+            values = tuple(p.value for p in self.supported_protocols)
+            object.__setattr__(self, "_protocol_values", values)
+        return values
+    
     def __post_init__(self):
         if self.current_protocol is None and self.supported_protocols:
             self.current_protocol = self.supported_protocols[0]
     
     def get_security_score(self) -> float:
         """Calculate security score of this connection"""
-        base_score = self.encryption_level / 100.0
-        
-        # Protocol security modifiers
-        protocol_scores = {
-            Protocol.HTTP: 0.3,
-            Protocol.HTTPS: 0.8,
-            Protocol.TCP: 0.5,
-            Protocol.UDP: 0.4,
-            Protocol.TLS: 0.9,
-            Protocol.IPSEC: 0.95,
-            Protocol.SSH: 0.85,
-            Protocol.FTP: 0.2
-        }
-        
-        protocol_score = protocol_scores.get(self.current_protocol, 0.5)
+        # Mean of encryption_level / 100 and the protocol score, folded into one multiply-add
+        protocol = self.current_protocol
+        protocol_half = _PROTOCOL_SECURITY_HALVES[protocol.ordinal] if protocol is not None else 0.25
         
-        return (base_score + protocol_score) / 2
+        return self.encryption_level * 0.005 + protocol_half
     
     def to_dict(self):
-        return {
-        "id": self.id,
-        "source": self.source_id,
-        "target": self.target_id,
-        "bandwidth": self.bandwidth,
-        "latency": self.latency,
-        "supported_protocols": [p.value for p in self.supported_protocols],
-        "current_protocol": self.current_protocol.value if self.current_protocol else None,
-        "encryption_level": self.encryption_level,
-        "is_monitored": self.is_monitored,
-        "traffic_volume": self.traffic_volume,
-        "packet_count": self.packet_count,
-        "error_rate": self.error_rate,
-        "security_score": self.get_security_score()
-    }
\ No newline at end of file
+        if self._cached_dict is None:
+            d = dict(zip(_EDGE_DICT_KEYS, _get_edge_dict_fields(self)))
+            d["supported_protocols"] = self._supported_protocol_values()
+            d["current_protocol"] = self.current_protocol.value if self.current_protocol else None
+            d["security_score"] = self.get_security_score()
+            self._cached_dict = d
+        return dict(self._cached_dict)
\ No newline at end of file
@@ -1,69 +1,217 @@
 import networkx as nx
-from typing import Dict, List, Optional, Tuple, Any
+import numpy as np
+from collections import defaultdict
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from typing import Dict, List, Optional, Set, Tuple, Any
 import random
-import string
 
 from backend.simulation.config.network_config import NetworkConfig
 from .network_node import NetworkNode, NodeType, OperatingSystem
 from .network_edge import NetworkEdge, Protocol
 
+# Node colors used by visualize()
+_NODE_TYPE_COLORS = {
+    NodeType.SERVER: 'red',
+    NodeType.CLIENT: 'green',
+    NodeType.ROUTER: 'blue',
+    NodeType.FIREWALL: 'orange',
+    NodeType.SWITCH: 'purple',
+}
+
+# Services given to hand-built nodes in create_small_office_network()
+_DEFAULT_SERVICES = {
+    NodeType.SERVER: ("http", "ssh", "database"),
+    NodeType.CLIENT: ("browser", "email", "office"),
+    NodeType.ROUTER: ("routing", "nat", "dhcp"),
+    NodeType.FIREWALL: ("firewall", "ids", "vpn"),
+    NodeType.SWITCH: ("switching", "vlan"),
+    NodeType.HONEYPOT: ("http", "ssh", "ftp", "telnet"),
+}
+
+# MAC layout: fixed OUI plus a NIC part starting at 3C:4D:00
+_MAC_OUI = "00:1A:2B:"
+_MAC_BASE = 0x3C4D00
+
+# Value scores used by _get_value_score(), checked in this order
+_TOP_VALUE_KEYWORDS = ("CEO", "Database")
+_TYPE_VALUE_SCORES = {
+    NodeType.SERVER: 8,
+    NodeType.FIREWALL: 7,
+    NodeType.ROUTER: 7,
+}
+
+# Static layout for create_small_office_network()
+_SMALL_OFFICE_NODES: Tuple[Tuple[str, str, NodeType, OperatingSystem, str], ...] = (
+    # Core infrastructure
+    ("router_1", "Main Router", NodeType.ROUTER, OperatingSystem.CUSTOM, "192.168.1.1"),
+    ("switch_1", "Core Switch", NodeType.SWITCH, OperatingSystem.CUSTOM, "192.168.1.2"),
+    ("firewall_1", "Firewall", NodeType.FIREWALL, OperatingSystem.LINUX, "192.168.1.3"),
+    
+    # Servers
+    ("web_server", "Web Server", NodeType.SERVER, OperatingSystem.LINUX, "192.168.1.10"),
+    ("file_server", "File Server", NodeType.SERVER, OperatingSystem.LINUX, "192.168.1.11"),
+    ("db_server", "Database Server", NodeType.SERVER, OperatingSystem.LINUX, "192.168.1.12"),
+    
+    # Client machines
+    ("client_1", "CEO Laptop", NodeType.CLIENT, OperatingSystem.WINDOWS, "192.168.1.100"),
+    ("client_2", "IT Admin", NodeType.CLIENT, OperatingSystem.LINUX, "192.168.1.101"),
+    ("client_3", "Sales PC", NodeType.CLIENT, OperatingSystem.WINDOWS, "192.168.1.102"),
+)
+
+_SMALL_OFFICE_CONNECTIONS: Tuple[Tuple[str, str], ...] = (
+    ("router_1", "switch_1"),
+    ("switch_1", "firewall_1"),
+    ("firewall_1", "web_server"),
+    ("firewall_1", "file_server"),
+    ("firewall_1", "db_server"),
+    ("switch_1", "client_1"),
+    ("switch_1", "client_2"),
+    ("switch_1", "client_3"),
+)
+
+def _mac_address(nic: int) -> str:
+    """MAC under the simulator's 00:1A:2B OUI with a 24-bit NIC part"""
+    return _MAC_OUI + nic.to_bytes(3, "big").hex(":").upper()
+
+# NetworkEdge fields the graph's edge indexes are keyed on
+_EDGE_KEY_FIELDS = frozenset(("id", "source_id", "target_id"))
+
+def _endpoint_key(u: str, v: str) -> Tuple[str, str]:
+    """Order-independent key for an undirected edge's endpoints"""
+    return (u, v) if u < v else (v, u)
+
 class NetworkGraph:
     def __init__(self):
         self.graph = nx.Graph()
         self.nodes: Dict[str, NetworkNode] = {}
         self.edges: Dict[str, NetworkEdge] = {}
+        self.node_counter = 0
         self.edge_counter = 0
+        # Maps an unordered endpoint pair to its edge ID for O(1) get_edge
+        self._endpoint_index: Dict[Tuple[str, str], str] = {}
+        # Edge IDs incident to each node, for O(deg) remove_node
+        self._node_edges: Dict[str, Set[str]] = defaultdict(set)
+        # Dense edge ID array plus each ID's slot in it, for O(1) random_edge
+        self._edge_ids: List[str] = []
+        self._edge_slots: Dict[str, int] = {}
+        # Topology metrics for to_dict, reset whenever nodes or edges change
+        self._metrics_cache: Optional[Dict[str, Any]] = None
+        # spring_layout positions for visualize, reset on the same changes
+        self._layout_cache: Optional[Dict[str, Any]] = None
     
     def add_node(self, node: NetworkNode) -> None:
         self.nodes[node.id] = node
-        
-        # Add node attributes without the 'id' field
-        node_data = node.to_dict()
-        # Remove 'id' from node data since node ID is the key in NetworkX
-        node_data.pop('id', None)
-        
-        self.graph.add_node(node.id, **node_data)
+        self._metrics_cache = None
+        self._layout_cache = None
+        self.graph.add_node(node.id, **node.to_graph_attrs())
     
     def add_edge(self, edge: NetworkEdge) -> None:
-        self.edges[edge.id] = edge
+        # One edge per ID and per node pair: the new edge replaces whichever held either
+        if edge.id in self.edges:
+            self.remove_edge(edge.id)
+        previous_id = self._endpoint_index.get(_endpoint_key(edge.source_id, edge.target_id))
+        if previous_id is not None:
+            self.remove_edge(previous_id)
         
-        # Get edge data without the 'id' field
-        edge_data = edge.to_dict()
-        # Remove fields that conflict with NetworkX or are redundant
-        edge_data.pop('id', None)
-        edge_data.pop('source', None)
-        edge_data.pop('target', None)
-        
-        # Add edge with attributes
-        self.graph.add_edge(edge.source_id, edge.target_id, **edge_data)
+        self.edges[edge.id] = edge
+        self._metrics_cache = None
+        self._layout_cache = None
+        self._endpoint_index[_endpoint_key(edge.source_id, edge.target_id)] = edge.id
+        self._node_edges[edge.source_id].add(edge.id)
+        self._node_edges[edge.target_id].add(edge.id)
+        if edge.id not in self._edge_slots:
+            self._edge_slots[edge.id] = len(self._edge_ids)
+            self._edge_ids.append(edge.id)
         
-        # Store the edge ID separately as an attribute
-        self.graph[edge.source_id][edge.target_id]['edge_id'] = edge.id
+        # The NetworkX graph only carries topology; attributes live on self.edges
+        self.graph.add_edge(edge.source_id, edge.target_id, edge_id=edge.id)
     
     def remove_node(self, node_id: str) -> bool:
         if node_id in self.nodes:
             del self.nodes[node_id]
+            self._metrics_cache = None
+            self._layout_cache = None
             self.graph.remove_node(node_id)
-            edge_ids_to_remove = [
-                eid for eid, edge in self.edges.items()
-                if edge.source_id == node_id or edge.target_id == node_id
-            ]
-            for eid in edge_ids_to_remove:
-                del self.edges[eid]
+            for eid in self._node_edges.pop(node_id, ()):
+                edge = self.edges.pop(eid, None)
+                if edge is not None:
+                    self._unindex_edge(edge)
             return True
         return False
     
+    def remove_edge(self, edge_id: str) -> bool:
+        edge = self.edges.pop(edge_id, None)
+        if edge is None:
+            return False
+        self._metrics_cache = None
+        self._layout_cache = None
+        self._unindex_edge(edge)
+        if self.graph.has_edge(edge.source_id, edge.target_id):
+            self.graph.remove_edge(edge.source_id, edge.target_id)
+        return True
+    
+    def _unindex_edge(self, edge: NetworkEdge) -> None:
+        key = _endpoint_key(edge.source_id, edge.target_id)
+        if self._endpoint_index.get(key) == edge.id:
+            del self._endpoint_index[key]
+        for endpoint in (edge.source_id, edge.target_id):
+            edge_ids = self._node_edges.get(endpoint)
+            if edge_ids is not None:
+                edge_ids.discard(edge.id)
+        
+        # Swap-remove from the dense ID array
+        slot = self._edge_slots.pop(edge.id, None)
+        if slot is not None:
+            last_id = self._edge_ids.pop()
+            if slot < len(self._edge_ids):
+                self._edge_ids[slot] = last_id
+                self._edge_slots[last_id] = slot
+    
+    def _clear_network(self) -> None:
+        self.graph.clear()
+        self.nodes.clear()
+        self.edges.clear()
+        self._endpoint_index.clear()
+        self._node_edges.clear()
+        self._edge_ids.clear()
+        self._edge_slots.clear()
+        self._metrics_cache = None
+        self._layout_cache = None
+        self.node_counter = 0
+        self.edge_counter = 0
+    
     def get_node(self, node_id: str) -> Optional[NetworkNode]:
         return self.nodes.get(node_id)
     
+    def random_edge(self) -> Optional[NetworkEdge]:
+        if not self.edges:
+            return None
+        edge = self.edges.get(random.choice(self._edge_ids)) if self._edge_ids else None
+        if edge is None:
+            # Edges inserted into self.edges directly bypass the dense array
+            edge = random.choice(list(self.edges.values()))
+        return edge
+    
+    def cpu_array(self) -> np.ndarray:
+        # Built on demand: node CPU usage is assigned directly on node objects, so a cached copy would go stale
+        return np.fromiter((node.cpu_usage for node in self.nodes.values()),
+                           dtype=np.float32, count=len(self.nodes))
+    
+    def has_edge(self, source_id: str, target_id: str) -> bool:
+        return (_endpoint_key(source_id, target_id) in self._endpoint_index
+                or self.graph.has_edge(source_id, target_id))
+    
     def get_edge(self, source_id: str, target_id: str) -> Optional[NetworkEdge]:
-        for edge in self.edges.values():
-            if (edge.source_id == source_id and edge.target_id == target_id) or \
-               (edge.source_id == target_id and edge.target_id == source_id):
-                return edge
+        edge_id = self._endpoint_index.get(_endpoint_key(source_id, target_id))
+        if edge_id in self.edges:
+            return self.edges[edge_id]
         
         if self.graph.has_edge(source_id, target_id):
             edge_data = self.graph[source_id][target_id]
+            if edge_data.get('edge_id') in self.edges:
+                return self.edges[edge_data['edge_id']]
+            
             edge_id = edge_data.get('edge_id', f"{source_id}_{target_id}")
             
             return NetworkEdge(
@@ -89,23 +237,25 @@ class NetworkGraph:
         if edge_id in self.edges:
             edge = self.edges[edge_id]
             
+            # Changing the ID or an endpoint moves the edge, so take it out of every index first
+            rekey = not _EDGE_KEY_FIELDS.isdisjoint(kwargs)
+            if rekey:
+                self.remove_edge(edge_id)
+            
             # Update the NetworkEdge object
             for key, value in kwargs.items():
                 if hasattr(edge, key):
                     setattr(edge, key, value)
             
-            # Also update the NetworkX graph
-            if self.graph.has_edge(edge.source_id, edge.target_id):
-                for key, value in kwargs.items():
-                    if key not in ['id', 'source_id', 'target_id']:
-                        self.graph[edge.source_id][edge.target_id][key] = value
-            
+            if rekey:
+                self.add_edge(edge)
             return True
         return False
     
     def generate_random_node_id(self) -> str:
         while True:
-            node_id = f"node_{''.join(random.choices(string.ascii_lowercase + string.digits, k=8))}"
+            self.node_counter += 1
+            node_id = f"node_{self.node_counter:08d}"
             if node_id not in self.nodes:
                 return node_id
     
@@ -115,100 +265,98 @@ class NetworkGraph:
     
     def create_small_office_network(self) -> None:
         # Clear existing network
-        self.graph.clear()
-        self.nodes.clear()
-        self.edges.clear()
-        self.edge_counter = 0
+        self._clear_network()
         
-        # Create nodes
-        nodes_data = [
-            # Core infrastructure
-            ("router_1", "Main Router", NodeType.ROUTER, OperatingSystem.CUSTOM, "192.168.1.1"),
-            ("switch_1", "Core Switch", NodeType.SWITCH, OperatingSystem.CUSTOM, "192.168.1.2"),
-            ("firewall_1", "Firewall", NodeType.FIREWALL, OperatingSystem.LINUX, "192.168.1.3"),
-            
-            # Servers
-            ("web_server", "Web Server", NodeType.SERVER, OperatingSystem.LINUX, "192.168.1.10"),
-            ("file_server", "File Server", NodeType.SERVER, OperatingSystem.LINUX, "192.168.1.11"),
-            ("db_server", "Database Server", NodeType.SERVER, OperatingSystem.LINUX, "192.168.1.12"),
-            
-            # Client machines
-            ("client_1", "CEO Laptop", NodeType.CLIENT, OperatingSystem.WINDOWS, "192.168.1.100"),
-            ("client_2", "IT Admin", NodeType.CLIENT, OperatingSystem.LINUX, "192.168.1.101"),
-            ("client_3", "Sales PC", NodeType.CLIENT, OperatingSystem.WINDOWS, "192.168.1.102"),
-        ]
+        # Create nodes, drawing the random attributes in one batch each
+        rng = np.random.default_rng()
+        mac_octets = rng.integers(0, 256, size=len(_SMALL_OFFICE_NODES))
+        security_levels = rng.integers(50, 91, size=len(_SMALL_OFFICE_NODES))
         
-        for node_id, name, node_type, os, ip in nodes_data:
+        for i, (node_id, name, node_type, os, ip) in enumerate(_SMALL_OFFICE_NODES):
             node = NetworkNode(
                 id=node_id,
                 name=name,
                 node_type=node_type,
                 os=os,
                 ip_address=ip,
-                mac_address=f"00:1A:2B:3C:4D:{random.randint(10,99):02d}",
-                security_level=random.randint(50, 90),
+                mac_address=_mac_address(_MAC_BASE | int(mac_octets[i])),
+                security_level=int(security_levels[i]),
                 services=self._get_default_services(node_type),
                 value_score=self._get_value_score(node_type, name)
             )
             self.add_node(node)
         
         # Create edges (connections)
-        connections = [
-            ("router_1", "switch_1"),
-            ("switch_1", "firewall_1"),
-            ("firewall_1", "web_server"),
-            ("firewall_1", "file_server"),
-            ("firewall_1", "db_server"),
-            ("switch_1", "client_1"),
-            ("switch_1", "client_2"),
-            ("switch_1", "client_3"),
-        ]
+        edge_protocols = (Protocol.HTTPS, Protocol.SSH)
+        bandwidths = rng.choice([100, 1000], size=len(_SMALL_OFFICE_CONNECTIONS))  # 100Mbps or 1Gbps
+        latencies = rng.uniform(1, 10, size=len(_SMALL_OFFICE_CONNECTIONS))  # 1-10ms
+        protocol_picks = rng.integers(0, len(edge_protocols), size=len(_SMALL_OFFICE_CONNECTIONS))
+        encryption_levels = rng.integers(70, 96, size=len(_SMALL_OFFICE_CONNECTIONS))
         
-        for source_id, target_id in connections:
+        for i, (source_id, target_id) in enumerate(_SMALL_OFFICE_CONNECTIONS):
             edge = NetworkEdge(
                 id=self.generate_random_edge_id(),
                 source_id=source_id,
                 target_id=target_id,
-                bandwidth=random.choice([100, 1000]),  # 100Mbps or 1Gbps
-                latency=random.uniform(1, 10),  # 1-10ms
+                bandwidth=int(bandwidths[i]),
+                latency=float(latencies[i]),
                 supported_protocols=[Protocol.TCP, Protocol.HTTP, Protocol.HTTPS, Protocol.SSH],
-                current_protocol=random.choice([Protocol.HTTPS, Protocol.SSH]),
-                encryption_level=random.randint(70, 95)
+                current_protocol=edge_protocols[protocol_picks[i]],
+                encryption_level=int(encryption_levels[i])
             )
             self.add_edge(edge)
     
     def _get_default_services(self, node_type: NodeType) -> List[str]:
-        defaults = {
-            NodeType.SERVER: ["http", "ssh", "database"],
-            NodeType.CLIENT: ["browser", "email", "office"],
-            NodeType.ROUTER: ["routing", "nat", "dhcp"],
-            NodeType.FIREWALL: ["firewall", "ids", "vpn"],
-            NodeType.SWITCH: ["switching", "vlan"],
-            NodeType.HONEYPOT: ["http", "ssh", "ftp", "telnet"]
-        }
-        return defaults.get(node_type, [])
+        return list(_DEFAULT_SERVICES.get(node_type, ()))
     
     def _get_value_score(self, node_type: NodeType, name: str) -> int:
-        if "CEO" in name or "Database" in name:
-            return 10
-        elif node_type == NodeType.SERVER:
-            return 8
-        elif node_type == NodeType.FIREWALL or node_type == NodeType.ROUTER:
-            return 7
-        elif "Admin" in name:
+        for keyword in _TOP_VALUE_KEYWORDS:
+            if keyword in name:
+                return 10
+        score = _TYPE_VALUE_SCORES.get(node_type)
+        if score is not None:
+            return score
+        if "Admin" in name:
             return 6
-        else:
-            return random.randint(3, 5)
+        return random.randint(3, 5)
+    
+    def _compute_topology_metrics(self) -> Dict[str, Any]:
+        """Density and connectivity from a CSR adjacency of self.nodes/self.edges"""
+        node_count = len(self.nodes)
+        if node_count == 0:
+            return {"density": 0, "is_connected": False}
+        
+        index = {nid: i for i, nid in enumerate(self.nodes)}
+        rows, cols = [], []
+        for edge in self.edges.values():
+            i = index.get(edge.source_id)
+            j = index.get(edge.target_id)
+            if i is not None and j is not None:
+                # Upper-triangular so each undirected pair is stored once
+                rows.append(min(i, j))
+                cols.append(max(i, j))
+        
+        adjacency = coo_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(node_count, node_count)
+        ).tocsr()
+        n_components, _ = connected_components(adjacency, directed=False)
+        
+        return {
+            "density": 2 * adjacency.nnz / (node_count * (node_count - 1)) if node_count > 1 else 0,
+            "is_connected": bool(n_components == 1)
+        }
     
     def to_dict(self) -> Dict:
+        if self._metrics_cache is None:
+            self._metrics_cache = self._compute_topology_metrics()
         return {
             "nodes": {nid: node.to_dict() for nid, node in self.nodes.items()},
             "edges": {eid: edge.to_dict() for eid, edge in self.edges.items()},
             "graph_metrics": {
                 "node_count": len(self.nodes),
                 "edge_count": len(self.edges),
-                "density": nx.density(self.graph) if len(self.nodes) > 1 else 0,
-                "is_connected": nx.is_connected(self.graph) if len(self.nodes) > 0 else False
+                **self._metrics_cache
             }
         }
     
@@ -219,24 +367,15 @@ class NetworkGraph:
             plt.figure(figsize=(12, 8))
             
             # Position nodes using spring layout
-            pos = nx.spring_layout(self.graph, seed=42)
+            if self._layout_cache is None or len(self._layout_cache) != self.graph.number_of_nodes():
+                self._layout_cache = nx.spring_layout(self.graph, seed=42)
+            pos = self._layout_cache
             
             # Draw nodes with different colors based on type
-            node_colors = []
-            for node_id in self.graph.nodes():
-                node_type = self.nodes[node_id].node_type
-                if node_type == NodeType.SERVER:
-                    node_colors.append('red')
-                elif node_type == NodeType.CLIENT:
-                    node_colors.append('green')
-                elif node_type == NodeType.ROUTER:
-                    node_colors.append('blue')
-                elif node_type == NodeType.FIREWALL:
-                    node_colors.append('orange')
-                elif node_type == NodeType.SWITCH:
-                    node_colors.append('purple')
-                else:
-                    node_colors.append('gray')
+            node_color_map = {
+                nid: _NODE_TYPE_COLORS.get(self.nodes[nid].node_type, 'gray')
+                for nid in self.graph.nodes()
+            }
             
             # Draw compromised nodes with a different shape
             compromised_nodes = [nid for nid, node in self.nodes.items() if node.is_compromised]
@@ -246,7 +385,7 @@ class NetworkGraph:
             nx.draw_networkx_nodes(
                 self.graph, pos, 
                 nodelist=normal_nodes,
-                node_color=[node_colors[list(self.graph.nodes()).index(nid)] for nid in normal_nodes],
+                node_color=[node_color_map[nid] for nid in normal_nodes],
                 node_size=500
             )
             
@@ -268,9 +407,11 @@ class NetworkGraph:
             
             # Draw edge labels (bandwidth)
             edge_labels = {}
-            for (u, v) in self.graph.edges():
-                if 'bandwidth' in self.graph[u][v]:
-                    edge_labels[(u, v)] = f"{self.graph[u][v]['bandwidth']}Mbps"
+            for u, v, edge_data in self.graph.edges(data=True):
+                edge = self.edges.get(edge_data.get('edge_id'))
+                bandwidth = edge.bandwidth if edge is not None else edge_data.get('bandwidth')
+                if bandwidth is not None:
+                    edge_labels[(u, v)] = f"{bandwidth}Mbps"
             
             nx.draw_networkx_edge_labels(self.graph, pos, edge_labels=edge_labels, font_size=8)
             
@@ -290,10 +431,7 @@ class NetworkGraph:
         from .config.network_config import NetworkConfig
     
         # Clear existing network
-        self.graph.clear()
-        self.nodes.clear()
-        self.edges.clear()
-        self.edge_counter = 0
+        self._clear_network()
     
         # Get configuration
         preset = NetworkConfig.get_topology_preset(preset_name)
@@ -343,9 +481,9 @@ class NetworkGraph:
                     node_type=node_type,
                     os=template.os,
                     ip_address=ip_address,
-                    mac_address=f"00:1A:2B:3C:4D:{node_id_counter:02d}",
+                    mac_address=_mac_address(_MAC_BASE + node_id_counter),
                     security_level=template.generate_security_level(),
-                    services=template.default_services.copy(),
+                    services=list(template.default_services),
                     value_score=template.generate_value_score()
                 )
             
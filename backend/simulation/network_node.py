@@ -1,5 +1,5 @@
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from .config.enums import NodeType, OperatingSystem
 
@@ -29,14 +29,43 @@ class NetworkNode:
     # Value for scoring
     value_score: int = 1  # 1-10, importance
     
+    # Serialized form, rebuilt lazily after any attribute change
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != "_cached_dict":
+            object.__setattr__(self, "_cached_dict", None)
+    
     def __post_init__(self):
         if self.services is None:
             self.services = []
     
     def to_dict(self):
         """Convert to dictionary for JSON serialization"""
+        if self._cached_dict is None:
+            self._cached_dict = {
+                "id": self.id,
+                "name": self.name,
+                "type": self.node_type.value,
+                "os": self.os.value,
+                "ip": self.ip_address,
+                "mac": self.mac_address,
+                "security_level": self.security_level,
+                "is_compromised": self.is_compromised,
+                "is_quarantined": self.is_quarantined,
+                "is_honeypot": self.is_honeypot,
+                "services": self.services,
+                "cpu_usage": self.cpu_usage,
+                "memory_usage": self.memory_usage,
+                "bandwidth_used": self.bandwidth_used,
+                "value_score": self.value_score
+            }
+        return dict(self._cached_dict)
+    
+    def to_graph_attrs(self) -> dict:
+        """Attributes stored on the NetworkX node (the ID is the key)"""
         return {
-            "id": self.id,
             "name": self.name,
             "type": self.node_type.value,
             "os": self.os.value,
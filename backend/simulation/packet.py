@@ -1,83 +1,254 @@
 from enum import Enum
-from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, List
-import uuid
-from datetime import datetime
+from dataclasses import dataclass, field, InitVar
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Tuple, Final
+import functools
+import json
 import math
+import time
+from datetime import datetime
 import random
+import itertools
+import numpy as np
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 from .config.enums import Protocol, PacketType, PacketStatus, Direction, QoSClass
 
-@dataclass
+# log2(n) for n < _LOG2_TABLE_SIZE (entry 0 unused), so entropy of typical payloads needs no log calls
+_LOG2_TABLE_SIZE = 4096
+_LOG2_TABLE = np.log2(np.arange(_LOG2_TABLE_SIZE, dtype=np.float64).clip(min=1))
+
+# Pre-sampled jitter factors, cycled through by get_transit_time (kept as floats in a list for cheap indexing)
+_JITTER_MASK = (1 << 16) - 1
+_JITTER_FACTORS = np.random.default_rng().uniform(-0.1, 0.1, _JITTER_MASK + 1).tolist()
+_jitter_index = itertools.count()
+
+if njit is not None:
+    @njit(cache=True)
+    def _entropy_bits_jit(buf):
+        """Byte counting and the entropy sum fused into compiled loops"""
+        counts = np.zeros(256, np.int64)
+        for b in buf:
+            counts[b] += 1
+        total = buf.size
+        weighted = 0.0
+        for c in counts:
+            if c:
+                weighted += c * math.log2(c)
+        return math.log2(total) - weighted / total
+else:
+    _entropy_bits_jit = None  # numba is optional; fall back to the numpy path
+
+@functools.lru_cache(maxsize=4096)
+def _parse_flow_id(flow_id: str) -> Optional[Tuple[str, Optional[int], str, Optional[int], Protocol]]:
+    """Split "src_ip:port-dst_ip:port-proto" once per distinct flow ID"""
+    parts = flow_id.split('-')
+    if len(parts) < 3:
+        return None
+    src_part, dst_part, proto = parts
+    src_ip_port = src_part.split(':')
+    dst_ip_port = dst_part.split(':')
+    return (
+        src_ip_port[0],
+        int(src_ip_port[1]) if len(src_ip_port) > 1 else None,
+        dst_ip_port[0],
+        int(dst_ip_port[1]) if len(dst_ip_port) > 1 else None,
+        Protocol(proto.lower()),
+    )
+
+def _short_id(prefix: str) -> str:
+    """Packet ID with 8 random hex digits (IDs only need to be unlikely to collide)"""
+    return f"{prefix}_{random.getrandbits(32):08x}"
+
+# Flag letters in the order Packet.__str__ prints them, pre-joined for every 6-bit combination
+_FLAG_LETTERS = (("S", 0x02), ("A", 0x10), ("F", 0x01), ("R", 0x04), ("P", 0x08), ("U", 0x20))
+_FLAG_STRS = tuple("".join(letter for letter, mask in _FLAG_LETTERS if bits & mask) for bits in range(64))
+
 class TCPFlags:
-    """TCP control flags"""
-    syn: bool = False
-    ack: bool = False
-    fin: bool = False
-    rst: bool = False
-    psh: bool = False
-    urg: bool = False
+    """TCP control flags, stored as the on-wire flag bits
+    
+    Instances are immutable, so the factory classmethods and Packet's default
+    hand out shared instances.
+    """
+    __slots__ = ("flags",)
+    
+    FIN = 0x01
+    SYN = 0x02
+    RST = 0x04
+    PSH = 0x08
+    ACK = 0x10
+    URG = 0x20
+    
+    def __init__(self, flags: int = 0, *, syn: bool = False, ack: bool = False,
+                 fin: bool = False, rst: bool = False, psh: bool = False, urg: bool = False):
+        object.__setattr__(self, "flags", flags
+                           | (TCPFlags.FIN if fin else 0)
+                           | (TCPFlags.SYN if syn else 0)
+                           | (TCPFlags.RST if rst else 0)
+                           | (TCPFlags.PSH if psh else 0)
+                           | (TCPFlags.ACK if ack else 0)
+                           | (TCPFlags.URG if urg else 0))
+    
+    @property
+    def fin(self) -> bool:
+        return bool(self.flags & TCPFlags.FIN)
+    
+    @property
+    def syn(self) -> bool:
+        return bool(self.flags & TCPFlags.SYN)
+    
+    @property
+    def rst(self) -> bool:
+        return bool(self.flags & TCPFlags.RST)
+    
+    @property
+    def psh(self) -> bool:
+        return bool(self.flags & TCPFlags.PSH)
+    
+    @property
+    def ack(self) -> bool:
+        return bool(self.flags & TCPFlags.ACK)
+    
+    @property
+    def urg(self) -> bool:
+        return bool(self.flags & TCPFlags.URG)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("TCPFlags instances are immutable")
+    
+    def __reduce__(self):
+        # Rebuild through from_int so copy/pickle hand back the shared instance
+        return (TCPFlags.from_int, (self.flags,))
+    
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TCPFlags):
+            return NotImplemented
+        return self.flags == other.flags
+    
+    def __hash__(self) -> int:
+        return hash(self.flags)
+    
+    def __repr__(self) -> str:
+        return f"TCPFlags(flags=0x{self.flags:02x})"
     
     def to_dict(self) -> Dict[str, bool]:
-        return {
-            "syn": self.syn,
-            "ack": self.ack,
-            "fin": self.fin,
-            "rst": self.rst,
-            "psh": self.psh,
-            "urg": self.urg
-        }
+        return TCPFlags.decode(self.flags)
+    
+    @staticmethod
+    def decode(flag_int: int) -> Dict[str, bool]:
+        """Per-flag booleans for a TCP flag integer (e.g. a packet dict's tcp_flags_int)"""
+        return dict(_FLAG_DICTS[flag_int & 0x3F])
     
     def to_int(self) -> int:
         """Convert flags to TCP flag integer representation"""
-        flags = 0
-        if self.fin: flags |= 0x01
-        if self.syn: flags |= 0x02
-        if self.rst: flags |= 0x04
-        if self.psh: flags |= 0x08
-        if self.ack: flags |= 0x10
-        if self.urg: flags |= 0x20
-        return flags
+        return self.flags
     
     @classmethod
     def from_int(cls, flag_int: int) -> 'TCPFlags':
         """Create from TCP flag integer"""
-        return cls(
-            fin=bool(flag_int & 0x01),
-            syn=bool(flag_int & 0x02),
-            rst=bool(flag_int & 0x04),
-            psh=bool(flag_int & 0x08),
-            ack=bool(flag_int & 0x10),
-            urg=bool(flag_int & 0x20)
-        )
+        return _FLAG_INSTANCES[flag_int & 0x3F]
     
     @classmethod
-    def syn_ack(cls) -> 'TCPFlags':
-        """SYN-ACK flags for TCP handshake"""
-        return cls(syn=True, ack=True)
+    def syn_only(cls) -> 'TCPFlags':
+        """SYN flag for TCP connection initiation"""
+        return _FLAG_INSTANCES[cls.SYN]
     
     @classmethod
-    def syn(cls) -> 'TCPFlags':
-        """SYN flag for connection initiation"""
-        return cls(syn=True)
-    
-    @classmethod
-    def ack(cls) -> 'TCPFlags':
-        """ACK flag for data acknowledgment"""
-        return cls(ack=True)
+    def syn_ack(cls) -> 'TCPFlags':
+        """SYN-ACK flags for TCP handshake"""
+        return _FLAG_INSTANCES[cls.SYN | cls.ACK]
     
     @classmethod
     def fin_ack(cls) -> 'TCPFlags':
         """FIN-ACK for connection termination"""
-        return cls(fin=True, ack=True)
+        return _FLAG_INSTANCES[cls.FIN | cls.ACK]
+
+# Shared instance for every 6-bit flag combination
+_FLAG_INSTANCES = tuple(TCPFlags(flags=bits) for bits in range(64))
+_NO_FLAGS = _FLAG_INSTANCES[0]
+
+# Decoded form of every 6-bit flag combination, copied out by TCPFlags.decode()
+_FLAG_DICTS = tuple(
+    {
+        "syn": bool(bits & TCPFlags.SYN),
+        "ack": bool(bits & TCPFlags.ACK),
+        "fin": bool(bits & TCPFlags.FIN),
+        "rst": bool(bits & TCPFlags.RST),
+        "psh": bool(bits & TCPFlags.PSH),
+        "urg": bool(bits & TCPFlags.URG)
+    }
+    for bits in range(64)
+)
+
+@dataclass(frozen=True, slots=True)
+class _AttackPacketSpec:
+    """Shape of one attack type's packets; random fields are drawn uniformly from these"""
+    id_prefix: str
+    destination_ports: Tuple[int, ...]
+    protocols: Tuple[Protocol, ...]
+    tcp_flags: Tuple[TCPFlags, ...]
+    payload: str
+    payload_repeat: Tuple[int, int]  # inclusive range of payload repetitions
+    payload_size: Tuple[int, int]  # inclusive range, bytes
+    payload_entropy: Tuple[float, float]
+    requires_ack: bool = False
+
+# Shared by Packet.create_attack_packet and Packet.create_attack_packets
+_ATTACK_PACKET_SPECS: Final = MappingProxyType({
+    "port_scan": _AttackPacketSpec(
+        id_prefix="atk",
+        destination_ports=tuple(range(1, 1025)),  # Scan well-known ports
+        protocols=(Protocol.TCP, Protocol.UDP),
+        tcp_flags=(TCPFlags.syn_only(), _NO_FLAGS),
+        payload="PORT_SCAN",
+        payload_repeat=(1, 1),
+        payload_size=(40, 100),
+        payload_entropy=(0.3, 0.6),
+    ),
+    "ddos": _AttackPacketSpec(
+        id_prefix="ddos",
+        destination_ports=(80, 443, 53),  # Common DDoS targets
+        protocols=(Protocol.UDP,),  # Common for amplification attacks
+        tcp_flags=(_NO_FLAGS,),
+        payload="DDoS",
+        payload_repeat=(10, 100),
+        payload_size=(500, 1500),
+        payload_entropy=(0.7, 0.9),  # High entropy for DDoS
+    ),
+    "brute_force": _AttackPacketSpec(
+        id_prefix="brute",
+        destination_ports=(22, 23, 3389),  # SSH, Telnet, RDP
+        protocols=(Protocol.TCP,),
+        tcp_flags=(TCPFlags.from_int(TCPFlags.ACK | TCPFlags.PSH),),
+        payload="LOGIN_ATTEMPT",
+        payload_repeat=(1, 1),
+        payload_size=(50, 200),
+        payload_entropy=(0.4, 0.7),
+        requires_ack=True,
+    ),
+})
 
-@dataclass
+@dataclass(slots=True)
 class Packet:
     """
     Represents a network packet with real-world attributes
+    
+    flow_id is an init-only argument backed by a lazy property: when not given,
+    the 5-tuple ID is built on first read from the addresses set by then. It is
+    therefore left out of repr(), == and dataclasses.asdict(); to_dict() and
+    to_json() include it.
     """
     # Core identification
     packet_id: str
-    flow_id: Optional[str] = None  # For tracking flows/sessions
+    flow_id: InitVar[Optional[str]] = None  # For tracking flows/sessions; see Packet.flow_id below
     source_id: str = ""
     destination_id: str = ""
     
@@ -90,7 +261,7 @@ class Packet:
     packet_type: PacketType = PacketType.DATA
     
     # Transport layer
-    tcp_flags: TCPFlags = field(default_factory=TCPFlags)
+    tcp_flags: TCPFlags = _NO_FLAGS  # Shared; TCPFlags is immutable
     sequence_number: int = 0
     acknowledgment_number: int = 0
     window_size: int = 65535
@@ -108,7 +279,7 @@ class Packet:
     ecn_marked: bool = False  # Explicit Congestion Notification
     
     # Metadata
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.time)  # Unix epoch seconds
     ttl: int = 64  # Time To Live
     requires_ack: bool = True
     
@@ -126,17 +297,27 @@ class Packet:
     threat_score: float = 0.0  # 0-1
     vlan_id: Optional[int] = None  # VLAN tagging
     
-    def __post_init__(self):
+    # Explicit flow ID, or the 5-tuple one once it has been read
+    _flow_id: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    # Membership index for path_taken, built on the first update_status that passes a node
+    _path_set: Optional[set] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self, flow_id: Optional[str]):
         """Initialize derived fields"""
-        if not self.flow_id:
-            # Generate flow ID from 5-tuple
-            self.flow_id = self._generate_flow_id()
-        
-        if self.payload and not self.payload_size:
-            self.payload_size = len(self.payload.encode('utf-8'))
+        if flow_id:
+            self._flow_id = flow_id
         
-        if self.payload and self.payload_entropy == 0.0:
-            self.payload_entropy = self._calculate_entropy(self.payload)
+        if self.payload and (not self.payload_size or self.payload_entropy == 0.0):
+            if self.payload_entropy == 0.0:
+                encoded = self.payload.encode('utf-8')
+                if not self.payload_size:
+                    self.payload_size = len(encoded)
+                self.payload_entropy = self._calculate_entropy_bytes(encoded)
+            elif self.payload.isascii():
+                # One byte per character, so the size needs no encode
+                self.payload_size = len(self.payload)
+            else:
+                self.payload_size = len(self.payload.encode('utf-8'))
         
         if not self.source_ip and self.source_id:
             # Try to get IP from node if available
@@ -145,6 +326,16 @@ class Packet:
         if not self.destination_ip and self.destination_id:
             pass  # We'll handle this in traffic generator
     
+    def _get_flow_id(self) -> str:
+        flow_id = self._flow_id
+        if not flow_id:
+            # Generate flow ID from 5-tuple on first use
+            flow_id = self._flow_id = self._generate_flow_id()
+        return flow_id
+    
+    def _set_flow_id(self, flow_id: Optional[str]) -> None:
+        self._flow_id = flow_id
+    
     def _generate_flow_id(self) -> str:
         """Generate flow ID from 5-tuple"""
         src_port = self.source_port or 0
@@ -156,24 +347,39 @@ class Packet:
         """Calculate Shannon entropy of payload (0-1 scale)"""
         if not data:
             return 0.0
+        return Packet._calculate_entropy_bytes(data.encode('utf-8'))
+    
+    @staticmethod
+    def _calculate_entropy_bytes(data: bytes) -> float:
+        """Shannon entropy (0-1 scale) of an already-encoded payload"""
+        if not data:
+            return 0.0
+        
+        buf = np.frombuffer(data, dtype=np.uint8)
+        if _entropy_bits_jit is not None:
+            return float(_entropy_bits_jit(buf)) / 8.0
         
         # Count frequency of each byte
-        freq = {}
-        for byte in data.encode('utf-8'):
-            freq[byte] = freq.get(byte, 0) + 1
+        counts = np.bincount(buf, minlength=256)
         
-        # Calculate entropy
-        entropy = 0.0
-        total_len = len(data)
-        for count in freq.values():
-            probability = count / total_len
-            entropy -= probability * math.log2(probability)
+        # H = log2(N) - sum(c * log2(c)) / N over the byte values that occur
+        total = buf.size
+        nonzero = counts[counts > 0]
+        if total < _LOG2_TABLE_SIZE:
+            entropy = float(_LOG2_TABLE[total] - (nonzero * _LOG2_TABLE[nonzero]).sum() / total)
+        else:
+            entropy = float(np.log2(total) - (nonzero * np.log2(nonzero)).sum() / total)
         
         # Normalize to 0-1 (max entropy for bytes is 8 bits)
         return entropy / 8.0
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert packet to dictionary with all real-world attributes"""
+    def to_dict(self, copy_lists: bool = False) -> Dict[str, Any]:
+        """Convert packet to dictionary with all real-world attributes
+        
+        path_taken is shared with the packet unless copy_lists is set,
+        which callers that mutate the result should pass. TCP flags are only
+        emitted as tcp_flags_int; use TCPFlags.decode() for per-flag booleans.
+        """
         return {
             # Core
             "id": self.packet_id,
@@ -190,7 +396,6 @@ class Packet:
             "type": self.packet_type.value,
             
             # Transport layer
-            "tcp_flags": self.tcp_flags.to_dict(),
             "tcp_flags_int": self.tcp_flags.to_int(),
             "seq_num": self.sequence_number,
             "ack_num": self.acknowledgment_number,
@@ -208,11 +413,11 @@ class Packet:
             "ecn_marked": self.ecn_marked,
             
             # Metadata
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": datetime.fromtimestamp(self.timestamp).isoformat(),
             "ttl": self.ttl,
             "status": self.status.value,
             "current_node": self.current_node,
-            "path_taken": self.path_taken.copy(),
+            "path_taken": self.path_taken.copy() if copy_lists else self.path_taken,
             "latency_ms": self.latency_accumulated,
             "jitter_ms": self.jitter,
             
@@ -225,18 +430,22 @@ class Packet:
             "requires_ack": self.requires_ack
         }
     
+    def to_json(self) -> bytes:
+        """Serialize the packet straight to compact JSON bytes"""
+        return _json_dumps(self.to_dict())
+    
     @classmethod
     def create_tcp_connection_syn(cls, source: str, destination: str, 
                                  source_port: int, dest_port: int) -> 'Packet':
         """Create TCP SYN packet for connection initiation"""
         return cls(
-            packet_id=f"tcp_syn_{uuid.uuid4().hex[:8]}",
+            packet_id=_short_id("tcp_syn"),
             source_id=source,
             destination_id=destination,
             source_port=source_port,
             destination_port=dest_port,
             protocol=Protocol.TCP,
-            tcp_flags=TCPFlags.syn(),
+            tcp_flags=TCPFlags.syn_only(),
             sequence_number=random.randint(1000, 9999),
             payload_size=0,
             direction=Direction.OUTBOUND
@@ -247,25 +456,22 @@ class Packet:
                               payload: str = "", psh: bool = True) -> 'Packet':
         """Create TCP data packet with proper sequencing"""
         # Parse flow ID to get connection details
-        parts = flow_id.split('-')
-        if len(parts) >= 3:
-            src_part, dst_part, proto = parts
-            src_ip_port = src_part.split(':')
-            dst_ip_port = dst_part.split(':')
+        parsed = _parse_flow_id(flow_id)
+        if parsed is not None:
+            source_ip, source_port, destination_ip, destination_port, protocol = parsed
             
             return cls(
-                packet_id=f"tcp_data_{uuid.uuid4().hex[:8]}",
+                packet_id=_short_id("tcp_data"),
                 flow_id=flow_id,
-                source_ip=src_ip_port[0],
-                source_port=int(src_ip_port[1]) if len(src_ip_port) > 1 else None,
-                destination_ip=dst_ip_port[0],
-                destination_port=int(dst_ip_port[1]) if len(dst_ip_port) > 1 else None,
-                protocol=Protocol(proto.lower()),
-                tcp_flags=TCPFlags(ack=True, psh=psh),
+                source_ip=source_ip,
+                source_port=source_port,
+                destination_ip=destination_ip,
+                destination_port=destination_port,
+                protocol=protocol,
+                tcp_flags=TCPFlags.from_int(TCPFlags.ACK | (TCPFlags.PSH if psh else 0)),
                 sequence_number=seq_num,
                 acknowledgment_number=ack_num,
                 payload=payload,
-                payload_size=len(payload.encode('utf-8')),
                 direction=Direction.OUTBOUND
             )
         return None
@@ -276,14 +482,13 @@ class Packet:
                          payload: str = "") -> 'Packet':
         """Create UDP packet"""
         return cls(
-            packet_id=f"udp_{uuid.uuid4().hex[:8]}",
+            packet_id=_short_id("udp"),
             source_id=source,
             destination_id=destination,
             source_port=source_port,
             destination_port=dest_port,
             protocol=Protocol.UDP,
             payload=payload,
-            payload_size=len(payload.encode('utf-8')),
             direction=Direction.OUTBOUND
         )
     
@@ -293,7 +498,7 @@ class Packet:
                           code: int = 0) -> 'Packet':
         """Create ICMP packet (ping)"""
         return cls(
-            packet_id=f"icmp_{uuid.uuid4().hex[:8]}",
+            packet_id=_short_id("icmp"),
             source_id=source,
             destination_id=destination,
             protocol=Protocol.ICMP,
@@ -307,7 +512,7 @@ class Packet:
                         query: str = "example.com") -> 'Packet':
         """Create DNS query packet"""
         return cls(
-            packet_id=f"dns_{uuid.uuid4().hex[:8]}",
+            packet_id=_short_id("dns"),
             source_id=source,
             destination_id=destination,
             source_port=random.randint(49152, 65535),  # Ephemeral port
@@ -319,67 +524,50 @@ class Packet:
             qos_class=QoSClass.STANDARD
         )
     
+    @classmethod
+    def _attack_packet(cls, spec: '_AttackPacketSpec', source: str, destination: str,
+                       threat_score: float, source_port: int, destination_port: int,
+                       protocol: Protocol, tcp_flags: TCPFlags, repeat: int,
+                       payload_size: int, payload_entropy: float) -> 'Packet':
+        """Build one attack packet of the given spec from already-drawn random values"""
+        return cls(
+            packet_id=_short_id(spec.id_prefix),
+            source_id=source,
+            destination_id=destination,
+            source_port=source_port,
+            destination_port=destination_port,
+            protocol=protocol,
+            tcp_flags=tcp_flags,
+            payload=spec.payload * repeat,
+            payload_size=payload_size,
+            payload_entropy=payload_entropy,
+            is_malicious=True,
+            threat_score=threat_score,
+            requires_ack=spec.requires_ack,
+            direction=Direction.OUTBOUND
+        )
+    
     @classmethod
     def create_attack_packet(cls, source: str, destination: str,
                             attack_type: str, threat_score: float = 0.8) -> 'Packet':
         """Create attack packet with realistic attributes"""
         # Different attack types have different characteristics
-        if attack_type == "port_scan":
-            return cls(
-                packet_id=f"atk_{uuid.uuid4().hex[:8]}",
-                source_id=source,
-                destination_id=destination,
-                source_port=random.randint(1024, 65535),
-                destination_port=random.randint(1, 1024),  # Scan well-known ports
-                protocol=random.choice([Protocol.TCP, Protocol.UDP]),
-                tcp_flags=TCPFlags(syn=True) if random.random() > 0.5 else TCPFlags(),
-                payload="PORT_SCAN",
-                payload_size=random.randint(40, 100),
-                payload_entropy=random.uniform(0.3, 0.6),
-                is_malicious=True,
-                threat_score=threat_score,
-                requires_ack=False,
-                direction=Direction.OUTBOUND
-            )
-        
-        elif attack_type == "ddos":
-            return cls(
-                packet_id=f"ddos_{uuid.uuid4().hex[:8]}",
-                source_id=source,
-                destination_id=destination,
+        spec = _ATTACK_PACKET_SPECS.get(attack_type)
+        if spec is not None:
+            return cls._attack_packet(
+                spec, source, destination, threat_score,
                 source_port=random.randint(1024, 65535),
-                destination_port=random.choice([80, 443, 53]),  # Common DDoS targets
-                protocol=Protocol.UDP,  # Common for amplification attacks
-                payload="DDoS" * random.randint(10, 100),
-                payload_size=random.randint(500, 1500),
-                payload_entropy=random.uniform(0.7, 0.9),  # High entropy for DDoS
-                is_malicious=True,
-                threat_score=threat_score,
-                requires_ack=False,
-                direction=Direction.OUTBOUND,
-                dscp=0  # Best effort (flood)
-            )
-        
-        elif attack_type == "brute_force":
-            return cls(
-                packet_id=f"brute_{uuid.uuid4().hex[:8]}",
-                source_id=source,
-                destination_id=destination,
-                source_port=random.randint(1024, 65535),
-                destination_port=random.choice([22, 23, 3389]),  # SSH, Telnet, RDP
-                protocol=Protocol.TCP,
-                tcp_flags=TCPFlags(ack=True, psh=True),
-                payload="LOGIN_ATTEMPT",
-                payload_size=random.randint(50, 200),
-                payload_entropy=random.uniform(0.4, 0.7),
-                is_malicious=True,
-                threat_score=threat_score,
-                direction=Direction.OUTBOUND
+                destination_port=random.choice(spec.destination_ports),
+                protocol=random.choice(spec.protocols),
+                tcp_flags=random.choice(spec.tcp_flags),
+                repeat=random.randint(*spec.payload_repeat),
+                payload_size=random.randint(*spec.payload_size),
+                payload_entropy=random.uniform(*spec.payload_entropy)
             )
         
         # Generic attack packet
         return cls(
-            packet_id=f"atk_{uuid.uuid4().hex[:8]}",
+            packet_id=_short_id("atk"),
             source_id=source,
             destination_id=destination,
             packet_type=PacketType.ATTACK,
@@ -391,12 +579,48 @@ class Packet:
             direction=Direction.OUTBOUND
         )
     
+    @classmethod
+    def create_attack_packets(cls, source: str, destination: str, attack_type: str,
+                              count: int, threat_score: float = 0.8) -> List['Packet']:
+        """Create `count` attack packets, drawing each random field in one numpy call"""
+        spec = _ATTACK_PACKET_SPECS.get(attack_type)
+        if spec is None:
+            return [cls.create_attack_packet(source, destination, attack_type, threat_score)
+                    for _ in range(count)]
+        
+        rng = np.random.default_rng()
+        src_ports = rng.integers(1024, 65536, size=count).tolist()
+        dst_ports = rng.integers(len(spec.destination_ports), size=count).tolist()
+        protocols = rng.integers(len(spec.protocols), size=count).tolist()
+        flags = rng.integers(len(spec.tcp_flags), size=count).tolist()
+        repeats = rng.integers(spec.payload_repeat[0], spec.payload_repeat[1] + 1, size=count).tolist()
+        sizes = rng.integers(spec.payload_size[0], spec.payload_size[1] + 1, size=count).tolist()
+        entropies = rng.uniform(*spec.payload_entropy, size=count).tolist()
+        
+        return [
+            cls._attack_packet(
+                spec, source, destination, threat_score,
+                source_port=src_ports[i],
+                destination_port=spec.destination_ports[dst_ports[i]],
+                protocol=spec.protocols[protocols[i]],
+                tcp_flags=spec.tcp_flags[flags[i]],
+                repeat=repeats[i],
+                payload_size=sizes[i],
+                payload_entropy=entropies[i]
+            )
+            for i in range(count)
+        ]
+    
     def update_status(self, new_status: PacketStatus, node_id: Optional[str] = None):
         """Update packet status and track path"""
         self.status = new_status
-        if node_id and node_id not in self.path_taken:
-            self.path_taken.append(node_id)
         if node_id:
+            path_set = self._path_set
+            if path_set is None:
+                path_set = self._path_set = set(self.path_taken)
+            if node_id not in path_set:
+                path_set.add(node_id)
+                self.path_taken.append(node_id)
             self.current_node = node_id
     
     def decrement_ttl(self) -> bool:
@@ -410,28 +634,31 @@ class Packet:
     def get_transit_time(self, edge_latency: float) -> float:
         """Calculate transit time over an edge with jitter"""
         # Add realistic jitter (10% of latency)
-        self.jitter = random.uniform(-0.1, 0.1) * edge_latency
+        self.jitter = _JITTER_FACTORS[next(_jitter_index) & _JITTER_MASK] * edge_latency
         return edge_latency + self.jitter
     
     def is_tcp_handshake(self) -> bool:
         """Check if this is a TCP handshake packet"""
-        return self.tcp_flags.syn
+        return bool(self.tcp_flags.flags & TCPFlags.SYN)
     
     def is_tcp_fin(self) -> bool:
         """Check if this is a TCP FIN packet"""
-        return self.tcp_flags.fin
+        return bool(self.tcp_flags.flags & TCPFlags.FIN)
     
     def is_tcp_rst(self) -> bool:
         """Check if this is a TCP RST packet"""
-        return self.tcp_flags.rst
+        return bool(self.tcp_flags.flags & TCPFlags.RST)
     
     def __str__(self) -> str:
         ports = f":{self.source_port}→{self.destination_port}" if self.source_port else ""
         flags = ""
         if self.protocol == Protocol.TCP:
-            flags = " [" + "".join([f.upper() for f in ['S','A','F','R','P','U'] 
-                                   if getattr(self.tcp_flags, f.lower())]) + "]"
+            flags = f" [{_FLAG_STRS[self.tcp_flags.flags & 0x3F]}]"
         
         return (f"Packet[{self.packet_id[:8]}] "
                 f"{self.source_id}{ports}→{self.destination_id} "
-                f"({self.protocol.value}{flags})")
\ No newline at end of file
+                f"({self.protocol.value}{flags})")
+
+# flow_id is an init-only dataclass argument; reads go through this lazy property.
+# It has to be attached after @dataclass, which would otherwise take it as the InitVar default.
+Packet.flow_id = property(Packet._get_flow_id, Packet._set_flow_id)
\ No newline at end of file
@@ -525,6 +525,7 @@ class TrafficGenerator:
     def generate_packets(self, time_delta: float = 1.0) -> List[Packet]:
         """Generate packets for all active connections"""
         new_packets = []
+        now = datetime.now()  # One timestamp per tick, shared by every connection
         
         for connection in list(self.connections.values()):
             if connection.protocol == Protocol.TCP:
@@ -550,23 +551,23 @@ class TrafficGenerator:
                 packets = []
             
             new_packets.extend(packets)
-            connection.last_activity = datetime.now()
+            connection.last_activity = now
         
         # Update statistics
         self.packets.extend(new_packets)
         self.traffic_stats["total_packets"] += len(new_packets)
-        self.traffic_stats["total_bytes"] += sum(
-            p.payload_size for p in new_packets if hasattr(p, 'payload_size')
-        )
+        self.traffic_stats["total_bytes"] += sum(p.payload_size for p in new_packets)
         
         # Clean up old connections (simulate connection timeout)
-        self._cleanup_old_connections(time_delta * 10)  # Scale timeout with time delta
+        self._cleanup_old_connections(time_delta * 10, now)  # Scale timeout with time delta
         
         return new_packets
     
-    def _cleanup_old_connections(self, max_idle_seconds: int = 300):
+    def _cleanup_old_connections(self, max_idle_seconds: int = 300,
+                                 now: Optional[datetime] = None):
         """Remove connections that have been idle too long"""
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         to_remove = []
         
         for conn_id, connection in self.connections.items():
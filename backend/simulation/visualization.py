@@ -10,38 +10,44 @@ from simulation import NetworkGraph
 import streamlit as st
 import plotly.graph_objects as go
 import networkx as nx
+import numpy as np
 import pandas as pd
 
+@st.cache_data
+def _spring_layout(node_ids, edge_pairs):
+    """Spring layout for a topology, cached across reruns by its node/edge tuples"""
+    G = nx.Graph()
+    G.add_nodes_from(node_ids)
+    G.add_edges_from(edge_pairs)
+    pos = nx.spring_layout(G, k=0.5, iterations=50, seed=42)
+    return {node: (float(x), float(y)) for node, (x, y) in pos.items()}
+
 def create_network_figure(network):
     """Create a Plotly figure from a NetworkGraph object."""
-    G = nx.Graph()
-    for node_id, node in network.nodes.items():
-        G.add_node(node_id, name=node.name, compromised=node.is_compromised)
-    for edge in network.edges:
-        G.add_edge(edge[0], edge[1])
+    nodes = network.nodes
+    node_ids = tuple(nodes)
+    edge_pairs = tuple((edge.source_id, edge.target_id) for edge in network.edges.values()
+                       if edge.source_id in nodes and edge.target_id in nodes)
     
-    pos = nx.spring_layout(G, k=0.5, iterations=50)
+    pos = _spring_layout(node_ids, edge_pairs)
+    pos_arr = np.array([pos[node] for node in node_ids], dtype=float).reshape(-1, 2)
+    index = {node: i for i, node in enumerate(node_ids)}
     
-    edge_x, edge_y = [], []
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    # Each edge becomes an (x0, x1, NaN) segment so one trace draws them all
+    edge_idx = np.array([(index[a], index[b]) for a, b in edge_pairs], dtype=np.intp).reshape(-1, 2)
+    segments = np.full((len(edge_idx), 3, 2), np.nan)
+    segments[:, 0] = pos_arr[edge_idx[:, 0]]
+    segments[:, 1] = pos_arr[edge_idx[:, 1]]
     
-    edge_trace = go.Scatter(x=edge_x, y=edge_y, mode='lines',
+    edge_trace = go.Scatter(x=segments[:, :, 0].ravel(), y=segments[:, :, 1].ravel(), mode='lines',
                             line=dict(width=0.5, color='#888'),
                             hoverinfo='none', showlegend=False)
     
-    node_x, node_y, node_color, node_text = [], [], [], []
-    for node in G.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        node_color.append('red' if G.nodes[node].get('compromised') else 'blue')
-        node_text.append(G.nodes[node].get('name', f"Node {node}"))
+    compromised = np.array([nodes[node].is_compromised for node in node_ids], dtype=bool)
+    node_color = np.where(compromised, 'red', 'blue')
+    node_text = [nodes[node].name or f"Node {node}" for node in node_ids]
     
-    node_trace = go.Scatter(x=node_x, y=node_y, mode='markers+text', text=node_text,
+    node_trace = go.Scatter(x=pos_arr[:, 0], y=pos_arr[:, 1], mode='markers+text', text=node_text,
                             marker=dict(size=10, color=node_color),
                             hoverinfo='text', showlegend=False)
     
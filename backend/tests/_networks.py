@@ -0,0 +1,13 @@
+"""Network builders shared by the test scripts and the pytest fixtures"""
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulation import NetworkGraph
+
+def build_small_office_network() -> NetworkGraph:
+    """Build the small office preset used across the test scripts"""
+    network = NetworkGraph()
+    network.create_small_office_network()
+    return network
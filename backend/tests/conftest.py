@@ -0,0 +1,13 @@
+import pytest
+
+from _networks import build_small_office_network
+
+@pytest.fixture
+def small_office_network():
+    """Fresh small office network for each test.
+    
+    The traffic and attack tests mutate node and edge state, so sharing one
+    network would make results depend on test order. Building the preset is
+    cheaper than deep-copying a shared one.
+    """
+    return build_small_office_network()
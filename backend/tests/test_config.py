@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulation import Protocol
+from simulation.config.network_config import NetworkConfig
+
+def test_protocol_config_lookup():
+    print("Testing protocol config lookup...")
+    
+    ssh_config = NetworkConfig.get_protocol_config(Protocol.SSH)
+    assert ssh_config is not None and ssh_config["default_ports"] == [22]
+    assert NetworkConfig.get_protocol_config(Protocol.ARP) is None
+    print(f"✅ SSH config: {ssh_config}")
+    
+    # Non-members fall back to a plain mapping lookup instead of raising
+    assert NetworkConfig.get_protocol_config(None) is None
+    assert NetworkConfig.get_protocol_config("not_a_protocol") is None
+    print("✅ Non-protocol lookups return None")
+
+if __name__ == "__main__":
+    test_protocol_config_lookup()
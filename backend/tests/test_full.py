@@ -1,8 +1,26 @@
 #!/usr/bin/env python3
+"""Comprehensive AegisGuard simulation test
+
+Environment variables:
+    AEGIS_TEST_VERBOSE  "1" prints status output (default when run as a script);
+                        "0" prints a single JSON report instead
+    AEGIS_RUN_PERF      "0" skips the performance test (default "1")
+"""
 import sys
 import os
+import io
+import contextlib
+import functools
+import json
 import time
-from datetime import datetime
+import tracemalloc
+from collections import Counter
+
+import numpy as np
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 # Add project root to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -10,42 +28,68 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 # Import simulation components at module level
 from simulation import (
     NetworkGraph, TrafficGenerator, AttackGenerator,
-    TrafficPattern, AttackType, Protocol, NodeType,
-    TrafficConfig, AttackConfig, NetworkNode, OperatingSystem
+    TrafficPattern, AttackType, NodeType,
+    NetworkNode, OperatingSystem
 )
+from _networks import build_small_office_network
+
+if njit is not None:
+    @njit(cache=True)
+    def _sum_sizes(sizes):
+        """Sum an int64 array of payload sizes (compiled once, cached on disk)"""
+        total = 0
+        for i in range(len(sizes)):
+            total += sizes[i]
+        return total
+else:
+    def _sum_sizes(sizes):
+        """Sum an int64 array of payload sizes (numba is optional)"""
+        return int(sizes.sum())
+
+# Status output is on by default when run as a script; set AEGIS_TEST_VERBOSE=1 to see it under pytest
+_VERBOSE = os.environ.get("AEGIS_TEST_VERBOSE", "1" if __name__ == "__main__" else "0") == "1"
+
+# Results collected by the tests, written as one JSON blob when status output is off
+_REPORT = {}
 
-def test_all_components():
+def vprint(*args, **kwargs):
+    """print() that is a no-op unless verbose output is enabled"""
+    if _VERBOSE:
+        print(*args, **kwargs)
+
+def test_all_components(small_office_network):
     """Test all simulation components together"""
-    print("🧪 AEGIS GUARD - COMPREHENSIVE TEST")
-    print("=" * 60)
+    vprint("🧪 AEGIS GUARD - COMPREHENSIVE TEST")
+    vprint("=" * 60)
     
     # ==================== TEST 1: NETWORK CREATION ====================
-    print("\n1. Testing Network Creation...")
-    print("-" * 40)
+    vprint("\n1. Testing Network Creation...")
+    vprint("-" * 40)
     
-    network = NetworkGraph()
-    network.create_small_office_network()
+    network = small_office_network
     
-    print(f"   ✅ Network created: {len(network.nodes)} nodes, {len(network.edges)} edges")
+    vprint(f"   ✅ Network created: {len(network.nodes)} nodes, {len(network.edges)} edges")
     
     # Show some nodes
-    print(f"   📊 Node types:")
-    node_counts = {}
-    for node in network.nodes.values():
-        node_type = node.node_type.value
-        node_counts[node_type] = node_counts.get(node_type, 0) + 1
+    vprint(f"   📊 Node types:")
+    node_counts = Counter(node.node_type.value for node in network.nodes.values())
+    _REPORT["network"] = {
+        "nodes": len(network.nodes),
+        "edges": len(network.edges),
+        "node_types": dict(node_counts),
+    }
     
     for node_type, count in node_counts.items():
-        print(f"      {node_type}: {count}")
+        vprint(f"      {node_type}: {count}")
     
     # ==================== TEST 2: TRAFFIC GENERATION ====================
-    print("\n2. Testing Traffic Generation...")
-    print("-" * 40)
+    vprint("\n2. Testing Traffic Generation...")
+    vprint("-" * 40)
     
     traffic_gen = TrafficGenerator(network)
     
     # Create some connections
-    print("   Creating traffic connections...")
+    vprint("   Creating traffic connections...")
     connections_created = 0
     
     # Web browsing from clients to web server
@@ -57,7 +101,7 @@ def test_all_components():
         )
         if conn:
             connections_created += 1
-            print(f"   ✅ Created web browsing connection")
+            vprint(f"   ✅ Created web browsing connection")
     
     # Database queries to db server
     if "db_server" in network.nodes and "client_2" in network.nodes:
@@ -68,41 +112,43 @@ def test_all_components():
         )
         if conn:
             connections_created += 1
-            print(f"   ✅ Created database connection")
+            vprint(f"   ✅ Created database connection")
     
     # Generate traffic for 3 seconds
-    print(f"   Generating traffic (3 seconds simulation)...")
+    vprint(f"   Generating traffic (3 seconds simulation)...")
     all_packets = []
     for i in range(3):
         packets = traffic_gen.generate_packets(time_delta=1.0)
         all_packets.extend(packets)
-        print(f"      Second {i+1}: {len(packets)} packets generated")
+        if _VERBOSE:
+            print("      Second %d: %d packets generated" % (i + 1, len(packets)))
     
     # Show traffic stats
     stats = traffic_gen.get_traffic_stats()
-    print(f"   📊 Traffic Statistics:")
-    print(f"      Total packets: {stats['total_packets']}")
-    print(f"      Total bytes: {stats['total_bytes']:,}")
-    print(f"      Active connections: {stats['active_connections']}")
-    print(f"      TCP connections: {stats['tcp_connections']}")
+    _REPORT["traffic"] = stats
+    vprint(f"   📊 Traffic Statistics:")
+    vprint(f"      Total packets: {stats['total_packets']}")
+    vprint(f"      Total bytes: {stats['total_bytes']:,}")
+    vprint(f"      Active connections: {stats['active_connections']}")
+    vprint(f"      TCP connections: {stats['tcp_connections']}")
     
     # Show sample packets
     if all_packets:
         sample = all_packets[0]
-        print(f"   📦 Sample packet:")
-        print(f"      Flow ID: {sample.flow_id[:30]}...")
-        print(f"      Protocol: {sample.protocol}")
-        print(f"      Size: {sample.payload_size} bytes")
-        print(f"      QoS: {sample.qos_class}")
+        vprint(f"   📦 Sample packet:")
+        vprint(f"      Flow ID: {sample.flow_id[:30]}...")
+        vprint(f"      Protocol: {sample.protocol}")
+        vprint(f"      Size: {sample.payload_size} bytes")
+        vprint(f"      QoS: {sample.qos_class}")
     
     # ==================== TEST 3: ATTACK GENERATION ====================
-    print("\n3. Testing Attack Generation...")
-    print("-" * 40)
+    vprint("\n3. Testing Attack Generation...")
+    vprint("-" * 40)
     
     attack_gen = AttackGenerator(network)
     
     # Generate specific attacks
-    print("   Generating specific attacks...")
+    vprint("   Generating specific attacks...")
     
     # Port scan attack
     port_scan = attack_gen.generate_specific_attack(
@@ -110,10 +156,10 @@ def test_all_components():
         intensity=0.7
     )
     if port_scan:
-        print(f"   ✅ Port scan attack created")
-        print(f"      Source: {port_scan.source_id}")
-        print(f"      Target: {port_scan.target_id}")
-        print(f"      Intensity: {port_scan.intensity:.2f}")
+        vprint(f"   ✅ Port scan attack created")
+        vprint(f"      Source: {port_scan.source_id}")
+        vprint(f"      Target: {port_scan.target_id}")
+        vprint(f"      Intensity: {port_scan.intensity:.2f}")
     
     # DDoS attack
     ddos = attack_gen.generate_specific_attack(
@@ -121,70 +167,72 @@ def test_all_components():
         intensity=0.9
     )
     if ddos:
-        print(f"   ✅ DDoS attack created")
-        print(f"      Source: {ddos.source_id}")
-        print(f"      Target: {ddos.target_id}")
+        vprint(f"   ✅ DDoS attack created")
+        vprint(f"      Source: {ddos.source_id}")
+        vprint(f"      Target: {ddos.target_id}")
     
     # Generate attack packets
-    print("   Generating attack packets (2 seconds simulation)...")
+    vprint("   Generating attack packets (2 seconds simulation)...")
     attack_packets = []
     for i in range(2):
         packets = attack_gen.update(time_delta=1.0)
         attack_packets.extend(packets)
-        print(f"      Second {i+1}: {len(packets)} attack packets")
+        if _VERBOSE:
+            print("      Second %d: %d attack packets" % (i + 1, len(packets)))
     
     # Show attack stats
     attack_stats = attack_gen.get_stats()
-    print(f"   📊 Attack Statistics:")
-    print(f"      Total attacks: {attack_stats['total_attacks']}")
-    print(f"      Active attacks: {attack_stats['active_attacks']}")
-    print(f"      Detected attacks: {attack_stats['detected_attacks']}")
-    print(f"      Total damage: {attack_stats['total_damage']:.2f}")
+    _REPORT["attack"] = attack_stats
+    vprint(f"   📊 Attack Statistics:")
+    vprint(f"      Total attacks: {attack_stats['total_attacks']}")
+    vprint(f"      Active attacks: {attack_stats['active_attacks']}")
+    vprint(f"      Detected attacks: {attack_stats['detected_attacks']}")
+    vprint(f"      Total damage: {attack_stats['total_damage']:.2f}")
     
     # Show sample attack packet
     if attack_packets:
         sample = attack_packets[0]
-        print(f"   💀 Sample attack packet:")
-        print(f"      Type: {sample.packet_type}")
-        print(f"      Malicious: {sample.is_malicious}")
-        print(f"      Threat score: {sample.threat_score:.2f}")
-        print(f"      Size: {sample.payload_size} bytes")
+        vprint(f"   💀 Sample attack packet:")
+        vprint(f"      Type: {sample.packet_type}")
+        vprint(f"      Malicious: {sample.is_malicious}")
+        vprint(f"      Threat score: {sample.threat_score:.2f}")
+        vprint(f"      Size: {sample.payload_size} bytes")
     
     # ==================== TEST 4: CONFIGURATION TEST ====================
-    print("\n4. Testing Configuration...")
-    print("-" * 40)
+    vprint("\n4. Testing Configuration...")
+    vprint("-" * 40)
     
     # Test traffic config
     try:
-        from simulation.config.traffic_config import TrafficConfig, TrafficPatternConfig
+        from simulation.config.traffic_config import TrafficPatternConfig
         web_config = TrafficPatternConfig(TrafficPattern.WEB_BROWSING)
-        print(f"   ✅ Traffic config loaded for WEB_BROWSING")
-        print(f"      Packet rate: {web_config.packet_rate_range} packets/sec")
-        print(f"      Avg size: {web_config.avg_packet_size} bytes")
-        print(f"      Protocol: {web_config.protocol}")
+        vprint(f"   ✅ Traffic config loaded for WEB_BROWSING")
+        vprint(f"      Packet rate: {web_config.packet_rate_range} packets/sec")
+        vprint(f"      Avg size: {web_config.avg_packet_size} bytes")
+        vprint(f"      Protocol: {web_config.protocol}")
     except Exception as e:
-        print(f"   ⚠️  Traffic config error: {e}")
+        vprint(f"   ⚠️  Traffic config error: {e}")
     
     # Test attack config
     try:
         from simulation.config.attack_config import AttackConfig
         ddos_config = AttackConfig.get_attack_config(AttackType.DDOS)
         if ddos_config:
-            print(f"   ✅ Attack config loaded for DDoS")
-            print(f"      Description: {ddos_config.get('description', 'N/A')}")
-            print(f"      Packet rate: {ddos_config.get('packet_rate_range', 'N/A')}")
+            vprint(f"   ✅ Attack config loaded for DDoS")
+            vprint(f"      Description: {ddos_config.get('description', 'N/A')}")
+            vprint(f"      Packet rate: {ddos_config.get('packet_rate_range', 'N/A')}")
             
         severity = AttackConfig.get_attack_severity(AttackType.DDOS)
-        print(f"      Severity: {severity.value}")
+        vprint(f"      Severity: {severity.value}")
     except Exception as e:
-        print(f"   ⚠️  Attack config error: {e}")
+        vprint(f"   ⚠️  Attack config error: {e}")
     
     # ==================== TEST 5: INTEGRATION TEST ====================
-    print("\n5. Testing Integration (Traffic + Attacks)...")
-    print("-" * 40)
+    vprint("\n5. Testing Integration (Traffic + Attacks)...")
+    vprint("-" * 40)
     
     # Simulate mixed traffic for 2 seconds
-    print("   Simulating normal traffic + attacks...")
+    vprint("   Simulating normal traffic + attacks...")
     
     mixed_stats = {
         "normal_packets": 0,
@@ -192,6 +240,7 @@ def test_all_components():
         "total_bytes": 0,
     }
     
+    empty_streak = 0
     for i in range(2):
         # Generate normal traffic
         normal_packets = traffic_gen.generate_packets(time_delta=1.0)
@@ -203,162 +252,204 @@ def test_all_components():
         
         # Calculate bytes
         all_packets = normal_packets + attack_packets
-        mixed_stats["total_bytes"] += sum(
-            p.payload_size for p in all_packets if hasattr(p, 'payload_size')
+        sizes = np.fromiter(
+            (p.payload_size for p in all_packets),
+            dtype=np.int64, count=len(all_packets)
         )
+        mixed_stats["total_bytes"] += int(sizes.sum())
         
-        print(f"      Second {i+1}: {len(normal_packets)} normal, {len(attack_packets)} attack")
-    
-    print(f"   📊 Mixed Simulation Results:")
-    print(f"      Total normal packets: {mixed_stats['normal_packets']}")
-    print(f"      Total attack packets: {mixed_stats['attack_packets']}")
+        if _VERBOSE:
+            print("      Second %d: %d normal, %d attack"
+                  % (i + 1, len(normal_packets), len(attack_packets)))
+        
+        # Nothing left to simulate once both generators have gone quiet
+        empty_streak = 0 if all_packets else empty_streak + 1
+        if empty_streak >= 2:
+            break
+    
+    _REPORT["mixed"] = mixed_stats
+    vprint(f"   📊 Mixed Simulation Results:")
+    vprint(f"      Total normal packets: {mixed_stats['normal_packets']}")
+    vprint(f"      Total attack packets: {mixed_stats['attack_packets']}")
     if (mixed_stats['normal_packets'] + mixed_stats['attack_packets']) > 0:
         attack_ratio = mixed_stats['attack_packets']/(mixed_stats['normal_packets'] + mixed_stats['attack_packets'])*100
-        print(f"      Attack ratio: {attack_ratio:.1f}%")
+        vprint(f"      Attack ratio: {attack_ratio:.1f}%")
     else:
-        print(f"      Attack ratio: 0.0%")
-    print(f"      Total bytes: {mixed_stats['total_bytes']:,}")
+        vprint(f"      Attack ratio: 0.0%")
+    vprint(f"      Total bytes: {mixed_stats['total_bytes']:,}")
     
     # ==================== TEST 6: NETWORK STATE ====================
-    print("\n6. Testing Network State...")
-    print("-" * 40)
+    vprint("\n6. Testing Network State...")
+    vprint("-" * 40)
     
     # Check compromised nodes
-    compromised = [
-        node.name for node in network.nodes.values() 
-        if node.is_compromised
-    ]
+    nodes = list(network.nodes.values())
+    compromised = [node.name for node in nodes if node.is_compromised]
     
     if compromised:
-        print(f"   ⚠️  Compromised nodes: {', '.join(compromised)}")
+        vprint(f"   ⚠️  Compromised nodes: {', '.join(compromised)}")
     else:
-        print(f"   ✅ No compromised nodes")
+        vprint(f"   ✅ No compromised nodes")
     
     # Check node statistics
-    total_cpu = sum(node.cpu_usage for node in network.nodes.values())
-    avg_cpu = total_cpu / len(network.nodes) if network.nodes else 0
+    cpu_arr = network.cpu_array()
+    avg_cpu = float(cpu_arr.mean()) if cpu_arr.size else 0.0
+    _REPORT["health"] = {"compromised": compromised, "avg_cpu": avg_cpu}
     
-    print(f"   📊 Network Health:")
-    print(f"      Average CPU usage: {avg_cpu:.1f}%")
-    print(f"      Total nodes: {len(network.nodes)}")
+    vprint(f"   📊 Network Health:")
+    vprint(f"      Average CPU usage: {avg_cpu:.1f}%")
+    vprint(f"      Total nodes: {len(nodes)}")
     
     # Visualize network
     try:
         network.visualize("tests/test_comprehensive_network.png")
-        print(f"   🎨 Network visualization saved: test_comprehensive_network.png")
+        vprint(f"   🎨 Network visualization saved: test_comprehensive_network.png")
     except Exception as e:
-        print(f"   ⚠️  Visualization failed: {e}")
+        vprint(f"   ⚠️  Visualization failed: {e}")
     
     return True
 
 def run_performance_test():
     """Run performance test with larger network"""
-    print("\n" + "=" * 60)
-    print("🏎️  PERFORMANCE TEST")
-    print("=" * 60)
+    vprint("\n" + "=" * 60)
+    vprint("🏎️  PERFORMANCE TEST")
+    vprint("=" * 60)
     
     try:
-        from simulation import NetworkGraph, TrafficGenerator, AttackGenerator
-        from simulation.config.network_config import NetworkConfig
-        
         # Test 1: Create larger network from config
-        print("\n1. Testing larger network creation...")
-        network = NetworkGraph()
-        
-        # Check if create_network_from_config exists
-        if hasattr(network, 'create_network_from_config'):
-            network.create_network_from_config("university_campus")
-        else:
-            print("   ⚠️  create_network_from_config not found, creating basic network")
-            # Fallback: manually create a larger network
-            network.create_small_office_network()
-            # Add more nodes manually
-            for i in range(20):
-                from simulation import NetworkNode, NodeType, OperatingSystem
-                node = NetworkNode(
-                    id=f"extra_node_{i}",
-                    name=f"Extra Node {i}",
-                    node_type=NodeType.CLIENT,
-                    os=OperatingSystem.WINDOWS,
-                    ip_address=f"192.168.1.{150 + i}",
-                    mac_address=f"00:AA:BB:CC:{i:02d}:{i:02d}",
-                    security_level=60,
-                    value_score=5
-                )
-                network.add_node(node)
-        
-        print(f"   ✅ Network created: {len(network.nodes)} nodes")
-        
-        # Test 2: Performance with traffic generation
-        print("\n2. Testing traffic generation performance...")
-        traffic_gen = TrafficGenerator(network)
-        attack_gen = AttackGenerator(network)
+        vprint("\n1. Testing larger network creation...")
+        tracemalloc.start()
+        try:
+            snap_start = tracemalloc.take_snapshot()
+            network = NetworkGraph()
+            
+            # Check if create_network_from_config exists
+            if hasattr(network, 'create_network_from_config'):
+                network.create_network_from_config("university_campus")
+            else:
+                vprint("   ⚠️  create_network_from_config not found, creating basic network")
+                # Fallback: manually create a larger network
+                network.create_small_office_network()
+                # Add more nodes manually
+                for i in range(20):
+                    node = NetworkNode(
+                        id=f"extra_node_{i}",
+                        name=f"Extra Node {i}",
+                        node_type=NodeType.CLIENT,
+                        os=OperatingSystem.WINDOWS,
+                        ip_address=f"192.168.1.{150 + i}",
+                        mac_address=f"00:AA:BB:CC:{i:02d}:{i:02d}",
+                        security_level=60,
+                        value_score=5
+                    )
+                    network.add_node(node)
+            
+            vprint(f"   ✅ Network created: {len(network.nodes)} nodes")
+            snap_network = tracemalloc.take_snapshot()
+            
+            # Test 2: Performance with traffic generation
+            vprint("\n2. Testing traffic generation performance...")
+            traffic_gen = TrafficGenerator(network)
+            attack_gen = AttackGenerator(network)
+            snap_generators = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
         
         # Create multiple connections
         nodes = list(network.nodes.values())
         if len(nodes) >= 10:
-            print("   Creating 10 traffic connections...")
+            vprint("   Creating 10 traffic connections...")
             for i in range(min(10, len(nodes))):
                 source = nodes[i]
-                # Find a different target
-                possible_targets = [n for n in nodes if n.id != source.id]
-                if possible_targets:
-                    target = possible_targets[i % len(possible_targets)]
-                    traffic_gen.create_connection(
-                        source.id,
-                        target.id,
-                        TrafficPattern.WEB_BROWSING
-                    )
+                # Node IDs are unique, so the next node is always a different target
+                target = nodes[(i + 1) % len(nodes)]
+                traffic_gen.create_connection(
+                    source.id,
+                    target.id,
+                    TrafficPattern.WEB_BROWSING
+                )
         
         # Measure packet generation speed
-        print("\n3. Testing packet generation speed...")
-        import time
+        vprint("\n3. Testing packet generation speed...")
         
         total_packets = 0
         iterations = 5
-        start_time = time.time()
-        
-        for i in range(iterations):
-            normal = traffic_gen.generate_packets(time_delta=1.0)
-            attacks = attack_gen.update(time_delta=1.0)
-            total_packets += len(normal) + len(attacks)
-            print(f"   Iteration {i+1}: {len(normal)} normal, {len(attacks)} attack packets")
+        iteration_ns = []
+        generated = []
+        # Compile (or load) the byte-count kernel before the clock starts
+        _sum_sizes(np.zeros(1, dtype=np.int64))
+        with _pinned_to_one_cpu():
+            start = time.perf_counter_ns()
+            
+            for i in range(iterations):
+                iter_start = time.perf_counter_ns()
+                normal = traffic_gen.generate_packets(time_delta=1.0)
+                attacks = attack_gen.update(time_delta=1.0)
+                iteration_ns.append(time.perf_counter_ns() - iter_start)
+                total_packets += len(normal) + len(attacks)
+                generated.append(normal)
+                generated.append(attacks)
+                if _VERBOSE:
+                    print("   Iteration %d: %d normal, %d attack packets"
+                          % (i + 1, len(normal), len(attacks)))
+            
+            end = time.perf_counter_ns()
+        elapsed = (end - start) / 1e9
         
-        end_time = time.time()
-        elapsed = end_time - start_time
+        # Byte accounting happens after the timed window so it isn't measured
+        sizes = np.fromiter(
+            (p.payload_size for packets in generated for p in packets),
+            dtype=np.int64, count=total_packets
+        )
+        total_bytes = int(_sum_sizes(sizes))
+        _REPORT["perf"] = {
+            "nodes": len(network.nodes),
+            "total_packets": total_packets,
+            "total_bytes": total_bytes,
+            "elapsed_s": elapsed,
+            "packets_per_second": total_packets / elapsed,
+            "iteration_ms_min": min(iteration_ns) / 1e6,
+            "iteration_ms_median": float(np.median(iteration_ns)) / 1e6,
+        }
         
-        print(f"\n   📊 Performance Results:")
-        print(f"      Total packets: {total_packets}")
-        print(f"      Total time: {elapsed:.2f} seconds")
-        print(f"      Packets per second: {total_packets/elapsed:.0f}")
-        print(f"      Real-time factor: {iterations/elapsed:.2f}x")
+        vprint(f"\n   📊 Performance Results:")
+        vprint(f"      Total packets: {total_packets}")
+        vprint(f"      Total bytes: {total_bytes:,}")
+        vprint(f"      Total time: {elapsed * 1e3:.2f} ms")
+        vprint(f"      Generation per iteration: min {min(iteration_ns) / 1e6:.2f} ms, "
+              f"median {np.median(iteration_ns) / 1e6:.2f} ms")
+        vprint(f"      Packets per second: {total_packets/elapsed:.0f}")
+        vprint(f"      Real-time factor: {iterations/elapsed:.2f}x")
         
         if elapsed < iterations:
-            print("      ✅ Faster than real-time (good for simulation)")
+            vprint("      ✅ Faster than real-time (good for simulation)")
         else:
-            print(f"      ⚠️  Slower than real-time (by {elapsed-iterations:.2f}s)")
+            vprint(f"      ⚠️  Slower than real-time (by {elapsed-iterations:.2f}s)")
         
         # Test 3: Memory usage (approximate)
-        print("\n4. Testing memory usage...")
-        import sys
-        network_size = sys.getsizeof(network)
-        traffic_size = sys.getsizeof(traffic_gen)
-        attack_size = sys.getsizeof(attack_gen)
+        vprint("\n4. Testing memory usage...")
+        network_size = sum(
+            stat.size_diff for stat in snap_network.compare_to(snap_start, 'filename')
+        )
+        generators_size = sum(
+            stat.size_diff for stat in snap_generators.compare_to(snap_network, 'filename')
+        )
         
-        print(f"   Memory usage (approx):")
-        print(f"      Network: {network_size:,} bytes")
-        print(f"      Traffic generator: {traffic_size:,} bytes")
-        print(f"      Attack generator: {attack_size:,} bytes")
-        print(f"      Total: {network_size + traffic_size + attack_size:,} bytes")
+        vprint(f"   Memory allocated (tracemalloc):")
+        vprint(f"      Network: {network_size:,} bytes")
+        vprint(f"      Traffic + attack generators: {generators_size:,} bytes")
+        vprint(f"      Total: {network_size + generators_size:,} bytes")
+        _REPORT["perf"]["network_bytes"] = network_size
+        _REPORT["perf"]["generators_bytes"] = generators_size
         
         # Test 4: Scalability
-        print("\n5. Testing scalability...")
+        vprint("\n5. Testing scalability...")
         if len(network.nodes) > 50:
-            print(f"   ✅ Good scalability: {len(network.nodes)} nodes handled")
+            vprint(f"   ✅ Good scalability: {len(network.nodes)} nodes handled")
         elif len(network.nodes) > 20:
-            print(f"   ⚠️  Moderate scalability: {len(network.nodes)} nodes")
+            vprint(f"   ⚠️  Moderate scalability: {len(network.nodes)} nodes")
         else:
-            print(f"   ⚠️  Limited scalability: only {len(network.nodes)} nodes")
+            vprint(f"   ⚠️  Limited scalability: only {len(network.nodes)} nodes")
         
     except Exception as e:
         print(f"   ❌ Performance test failed: {e}")
@@ -368,6 +459,29 @@ def run_performance_test():
     
     return True
 
+@contextlib.contextmanager
+def _pinned_to_one_cpu():
+    """Keep the process on a single CPU (Linux only) so timings don't include core migrations"""
+    if not hasattr(os, "sched_setaffinity"):
+        yield
+        return
+    allowed = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, {min(allowed)})
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, allowed)
+
+def _run_buffered(test_fn):
+    """Run a test with its status output collected in memory, written out in one go"""
+    buf = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buf):
+            return test_fn()
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
+
 def main():
     """Run all tests"""
     print("🚀 Starting Aegis Guard Comprehensive Test Suite")
@@ -377,16 +491,18 @@ def main():
     
     try:
         # Run main test
-        if not test_all_components():
+        if not _run_buffered(functools.partial(test_all_components,
+                                               build_small_office_network())):
             all_passed = False
         
         # Run performance test
-        print("\n" + "=" * 60)
-        print("Performance test will create a larger network for testing.")
-        print("This may take a moment...")
-        
-        if not run_performance_test():
-            all_passed = False
+        if os.environ.get("AEGIS_RUN_PERF", "1") == "1":
+            print("\n" + "=" * 60)
+            print("Performance test will create a larger network for testing.")
+            print("This may take a moment...")
+            
+            if not _run_buffered(run_performance_test):
+                all_passed = False
         
     except KeyboardInterrupt:
         print("\n\n⏹️  Test interrupted by user")
@@ -397,6 +513,9 @@ def main():
         traceback.print_exc()
         all_passed = False
     
+    if not _VERBOSE:
+        sys.stdout.write(json.dumps(_REPORT, indent=2, default=str) + "\n")
+    
     print("\n" + "=" * 60)
     if all_passed:
         print("🎉 ALL TESTS PASSED! 🎉")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+import sys
+import os
+import copy
+import pickle
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from simulation import Packet
+from simulation.packet import TCPFlags
+
+def test_packet_copy_and_pickle():
+    print("Testing Packet copy/pickle...")
+    
+    packet = Packet.create_tcp_connection_syn("client_1", "web_server", 40000, 443)
+    packet.update_status(packet.status, "router_1")
+    
+    for clone in (copy.deepcopy(packet), pickle.loads(pickle.dumps(packet))):
+        assert clone == packet
+        assert clone.flow_id == packet.flow_id
+        assert clone.tcp_flags is TCPFlags.syn_only()
+        assert clone.path_taken == packet.path_taken
+        assert clone.path_taken is not packet.path_taken
+    print(f"✅ Packet round-trips through deepcopy and pickle: {packet}")
+
+def test_flow_id():
+    print("\nTesting Packet flow IDs...")
+    
+    packet = Packet(packet_id="p1", source_ip="10.0.0.1", source_port=1234,
+                    destination_ip="10.0.0.2", destination_port=80)
+    assert packet.flow_id == "10.0.0.1:1234-10.0.0.2:80-tcp"
+    assert Packet(packet_id="p2", flow_id="custom").flow_id == "custom"
+    print(f"✅ Generated flow ID: {packet.flow_id}")
+    
+    # flow_id is not a dataclass field: it stays out of repr, == and asdict
+    same_but_flow = Packet(packet_id="p1", flow_id="other", source_ip="10.0.0.1", source_port=1234,
+                           destination_ip="10.0.0.2", destination_port=80,
+                           timestamp=packet.timestamp)
+    assert packet == same_but_flow
+    assert "flow_id" not in repr(packet)
+    assert "flow_id" not in asdict(packet)
+    assert packet.to_dict()["flow_id"] == packet.flow_id
+    packet_dict = packet.to_dict()
+    assert [f"{packet_dict[k]}" for k in ("protocol", "type", "direction", "qos_class", "status")] == \
+        ["tcp", "data", "outbound", "best_effort", "created"]
+    print("✅ flow_id excluded from repr/eq/asdict, present in to_dict")
+
+def _attack_shape(packet):
+    """The non-numeric fields of an attack packet (repeated payloads cut to a constant prefix)"""
+    return (packet.packet_id.split("_")[0], packet.source_id, packet.destination_id,
+            packet.protocol, packet.tcp_flags, packet.payload[:16],
+            packet.is_malicious, packet.threat_score, packet.requires_ack, packet.direction,
+            packet.packet_type)
+
+def test_attack_packet_batch_matches_single():
+    print("\nTesting batched attack packet creation...")
+    
+    count = 200
+    for attack_type in ("port_scan", "ddos", "brute_force", "unknown"):
+        batch = Packet.create_attack_packets("attacker", "web_server", attack_type, count, 0.9)
+        single = [Packet.create_attack_packet("attacker", "web_server", attack_type, 0.9)
+                  for _ in range(count)]
+        assert len(batch) == count
+        assert {_attack_shape(p) for p in batch} == {_attack_shape(p) for p in single}
+        
+        for field in ("source_port", "destination_port", "payload_size", "payload_entropy"):
+            values = [getattr(p, field) for p in batch]
+            reference = [getattr(p, field) for p in single]
+            if None in reference:
+                assert values == reference
+                continue
+            assert all(type(v) is type(r) for v, r in zip(values, reference))
+            # Independent uniform draws over the same range: the sample spans nearly overlap
+            span = max(reference) - min(reference)
+            assert min(values) >= min(reference) - span * 0.1
+            assert max(values) <= max(reference) + span * 0.1
+        print(f"✅ {attack_type}: {count} batched packets match single-packet shape")
+
+if __name__ == "__main__":
+    test_packet_copy_and_pickle()
+    test_flow_id()
+    test_attack_packet_batch_matches_single()
@@ -1,10 +1,14 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
 import pandas as pd
 import numpy as np
 import requests
 import json
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 from datetime import datetime, timedelta
 import time
 import socketio
@@ -22,6 +26,36 @@ gnn_predictions = []  # Store GNN predictions received from backend
 API_BASE_URL = "http://localhost:8000/api/v1"
 SOCKET_URL = "http://localhost:8000"
 
+# Chart templates (built once at import instead of on every rerun)
+_SMALL_CHART_MARGIN = dict(l=20, r=20, t=30, b=20)
+_TRAFFIC_LAYOUT = go.Layout(height=200, margin=_SMALL_CHART_MARGIN, title='Network Traffic')
+_PIE_LAYOUT = go.Layout(height=200, margin=_SMALL_CHART_MARGIN, title='Node Distribution')
+_PIE_COLORS = {
+    'Healthy': '#2ecc71',
+    'Compromised': '#e74c3c',
+    'Quarantined': '#f39c12',
+    'Monitoring': '#3498db',
+}
+# Threat label for every integer threat level 0-100 (>66 High, >33 Medium)
+_THREAT_LABELS = tuple(
+    "High" if level > 66 else "Medium" if level > 33 else "Low" for level in range(101)
+)
+_SEVERITY_CLASSES = {'High': 'critical-action', 'Critical': 'critical-action'}
+_ATTACK_COL_CFG = {
+    "type": "Attack Type",
+    "source": "Source",
+    "target": "Target",
+    "severity": st.column_config.NumberColumn(
+        "Severity",
+        help="Threat severity (0-1)",
+        format="%.2f",  # Show as decimal with 2 places
+        min_value=0,
+        max_value=1
+    ),
+    "status": "Status",
+    "agent_action": "Action"
+}
+
 # ============ API CLIENT ============
 class APIClient:
     """Real API client for backend communication"""
@@ -36,7 +70,7 @@ class APIClient:
             url = f"{self.base_url}{endpoint}"
             response = self.session.get(url, params=params, timeout=5)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.ConnectionError:
             st.error(f"❌ Cannot connect to backend at {self.base_url}. Make sure the Flask server is running.")
             return None
@@ -59,7 +93,7 @@ class APIClient:
             url = f"{self.base_url}{endpoint}"
             response = self.session.post(url, json=data, timeout=5)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except requests.exceptions.ConnectionError:
             st.error(f"❌ Cannot connect to backend at {self.base_url}")
             return None
@@ -76,7 +110,7 @@ class APIClient:
             url = f"{self.base_url}{endpoint}"
             response = self.session.put(url, json=data, timeout=5)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except Exception as e:
             st.error(f"❌ API Error: {str(e)}")
             return None
@@ -87,7 +121,7 @@ class APIClient:
             url = f"{self.base_url}{endpoint}"
             response = self.session.delete(url, timeout=5)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except Exception as e:
             st.error(f"❌ API Error: {str(e)}")
             return None
@@ -143,6 +177,18 @@ class SocketIOClient:
             self.sio.emit('request_update', {'timedelta': timedelta_seconds})
 
 # ============ VISUALIZATION FUNCTIONS ============
+# Keys that change on every poll without affecting what is drawn
+_VOLATILE_KEYS = frozenset({'last_seen', 'last_activity'})
+
+def payload_hash(*payloads):
+    """Hash API list payloads, ignoring per-request timestamps"""
+    stable = [
+        [{k: v for k, v in item.items() if k not in _VOLATILE_KEYS} if isinstance(item, dict) else item
+         for item in payload]
+        for payload in payloads
+    ]
+    return hash(json.dumps(stable, sort_keys=True, default=str))
+
 def create_network_graph(nodes, edges=None, connections=None):
     """Create an interactive network graph using Plotly
     
@@ -963,7 +1009,14 @@ hr {
         st.header("🌐 Network Visualization")
         
         if nodes:
-            fig = create_network_graph(nodes, edges, connections)
+            # Reuse the last figure when the topology payloads are unchanged
+            graph_hash = payload_hash(nodes, edges, connections)
+            cached = st.session_state.get('network_fig_cache')
+            if cached and cached[0] == graph_hash:
+                fig = cached[1]
+            else:
+                fig = create_network_graph(nodes, edges, connections)
+                st.session_state.network_fig_cache = (graph_hash, fig)
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No network data available. Make sure the backend is running.")
@@ -983,7 +1036,7 @@ hr {
     
     with col_stats:
         st.header("📈 Live Metrics")
-        threat_enum = "High" if threat_level > 66 else "Medium" if threat_level > 33 else "Low"
+        threat_enum = _THREAT_LABELS[min(max(threat_level, 0), 100)]
         
         # Threat gauge
         threat_gauge = create_threat_gauge(
@@ -994,18 +1047,22 @@ hr {
         
         # Traffic graph  
         metrics_history = st.session_state.api_client.get('/metrics/history?timeframe=3m') or []
-        traffic_df = pd.DataFrame({
-            'Time': [m.get('timestamp', '') for m in metrics_history],
-            'Traffic (Mbps)': [m.get('traffic_metrics', {}).get('current_bandwidth_mbps', 0) for m in metrics_history]
-        })
+        n_points = len(metrics_history)
+        times = np.empty(n_points, dtype='datetime64[ms]')
+        bandwidth = np.empty(n_points, dtype=np.float32)
+        for i, m in enumerate(metrics_history):
+            times[i] = m.get('timestamp') or 'NaT'
+            bandwidth[i] = m.get('traffic_metrics', {}).get('current_bandwidth_mbps', 0)
+        traffic_df = pd.DataFrame({'Time': times, 'Traffic (Mbps)': bandwidth})
             
         if not traffic_df.empty:
-            fig_traffic = px.line(
-                traffic_df, x='Time', y='Traffic (Mbps)',
-                title='Network Traffic',
-                color_discrete_sequence=['#3498db']
+            fig_traffic = go.Figure(
+                data=[go.Scatter(
+                    x=traffic_df['Time'], y=traffic_df['Traffic (Mbps)'],
+                    mode='lines', line=dict(color='#3498db')
+                )],
+                layout=_TRAFFIC_LAYOUT
             )
-            fig_traffic.update_layout(height=200, margin=dict(l=20, r=20, t=30, b=20))
             st.plotly_chart(fig_traffic, use_container_width=True)
         
         # Node distribution
@@ -1019,22 +1076,15 @@ hr {
                     status = 'Compromised'
                 status_counts[status] = status_counts.get(status, 0) + 1
             
-            status_df = pd.DataFrame({
-                'Status': list(status_counts.keys()),
-                'Count': list(status_counts.values())
-            })
-            
-            fig_pie = px.pie(
-                status_df, values='Count', names='Status',
-                title='Node Distribution',
-                color_discrete_map={
-                    'Healthy': '#2ecc71',
-                    'Compromised': '#e74c3c',
-                    'Quarantined': '#f39c12',
-                    'Monitoring': '#3498db',
-                }
+            statuses = list(status_counts.keys())
+            fig_pie = go.Figure(
+                data=[go.Pie(
+                    labels=statuses,
+                    values=list(status_counts.values()),
+                    marker=dict(colors=[_PIE_COLORS.get(s) for s in statuses])
+                )],
+                layout=_PIE_LAYOUT
             )
-            fig_pie.update_layout(height=200, margin=dict(l=20, r=20, t=30, b=20))
             st.plotly_chart(fig_pie, use_container_width=True)
     
     st.divider()
@@ -1084,20 +1134,7 @@ hr {
             # Display the dataframe
             st.dataframe(
                 styled_df,
-                column_config={
-                    "type": "Attack Type",
-                    "source": "Source",
-                    "target": "Target",
-                    "severity": st.column_config.NumberColumn(
-                        "Severity",
-                        help="Threat severity (0-1)",
-                        format="%.2f",  # Show as decimal with 2 places
-                        min_value=0,
-                        max_value=1
-                    ),
-                    "status": "Status",
-                    "agent_action": "Action"
-                },
+                column_config=_ATTACK_COL_CFG,
                 use_container_width=True,
                 hide_index=True
             )
@@ -1125,7 +1162,7 @@ hr {
         if agent_actions:
             for action in agent_actions[:8]:
                 severity = action.get('severity', 'Info')
-                severity_class = "critical-action" if severity in ["High", "Critical"] else ""
+                severity_class = _SEVERITY_CLASSES.get(severity, "")
                 
                 st.markdown(f"""
                     <div class="agent-action {severity_class}">
@@ -1190,21 +1227,31 @@ hr {
     # Third row - Honeypots
     st.header("🍯 Honeypot Deployment")
     
+    # Materialize caught attacks once for both the list and the stats
+    hp_df = pd.DataFrame(honeypots)
+    if 'attacks_caught' in hp_df:
+        attacks_caught = hp_df['attacks_caught'].map(lambda l: l if isinstance(l, list) else [])
+    else:
+        attacks_caught = pd.Series([[]] * len(hp_df), dtype=object)
+    recent_attacks = attacks_caught.map(lambda l: l[-3:])
+    
     col_honeypot_list, col_honeypot_stats = st.columns(2)
     
     with col_honeypot_list:
         st.subheader("Active Honeypots")
         if honeypots:
-            for hp in honeypots:
+            for hp, recent in zip(honeypots, recent_attacks):
                 with st.expander(f"🍯 {hp.get('name')} ({hp.get('type')})"):
                     st.write(f"**IP:** {hp.get('ip', 'N/A')}")
                     st.write(f"**Status:** {hp.get('status', 'Active')}")
                     st.write(f"**Triggers:** {hp.get('triggers', 0)}")
                     
-                    if hp.get('attacks_caught'):
+                    if recent:
                         st.write("**Attacks caught:**")
-                        for attack in hp.get('attacks_caught', [])[-3:]:
-                            st.caption(f"- {attack.get('attack_type')} at {attack.get('timestamp', 'N/A')}")
+                        st.caption("\n".join(
+                            f"- {attack.get('attack_type')} at {attack.get('timestamp', 'N/A')}"
+                            for attack in recent
+                        ))
                     
                     if st.button(f"Remove {hp.get('name')}", key=f"remove_{hp.get('id')}"):
                         result = st.session_state.api_client.delete(f"/honeypots/{hp.get('id')}")
@@ -1233,7 +1280,7 @@ hr {
         
         # Honeypot stats
         total_triggers = sum(hp.get('triggers', 0) for hp in honeypots)
-        total_attacks = sum(len(hp.get('attacks_caught', [])) for hp in honeypots)
+        total_attacks = int(attacks_caught.map(len).sum())
         
         col1, col2 = st.columns(2)
         with col1: